@@ -0,0 +1,26 @@
+"""Keyset index for per-user equation history
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-14
+"""
+from alembic import op
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_equations_user_created "
+            "ON equations (user_id, created_at DESC, id DESC)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_equations_user_created")
@@ -0,0 +1,32 @@
+"""Lowercase stored user emails
+
+Login and register normalize emails to lowercase, so rows written before
+that must match. Addresses that only differ by case are left alone rather
+than violating the unique index.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-14
+"""
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "UPDATE users SET email = lower(email) "
+        "WHERE email <> lower(email) "
+        "AND NOT EXISTS ("
+        "SELECT 1 FROM users AS other "
+        "WHERE other.id <> users.id AND lower(other.email) = lower(users.email)"
+        ")"
+    )
+
+
+def downgrade() -> None:
+    # The original casing is not recorded; lowercase emails stay valid
+    pass
@@ -1,7 +1,10 @@
-from fastapi import APIRouter
+import numpy as np
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 from typing import List, Any
 
+from app.ml.gesture_engine import NUM_LANDMARKS
+
 router = APIRouter()
 
 class GestureInferenceRequest(BaseModel):
@@ -13,12 +16,20 @@ class GestureInferenceResponse(BaseModel):
     confidence: float
 
 @router.post("/recognize", response_model=GestureInferenceResponse)
-async def infer_gesture(payload: GestureInferenceRequest):
-    # This is where high-level ML models would sit
-    # For now, we return a basic response to keep the architecture ready
+async def infer_gesture(payload: GestureInferenceRequest, request: Request):
+    engine = request.app.state.trt
+    if engine is None:
+        raise HTTPException(status_code=503, detail="Gesture engine unavailable")
+
+    try:
+        landmarks = np.asarray(payload.landmarks, dtype=np.float32).reshape(NUM_LANDMARKS, 3)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=422, detail="Expected 21 landmarks of (x, y, z)")
+
+    gesture_type, confidence = await engine.classify_async(landmarks)
     return {
-        "gesture_type": "pinch", 
-        "confidence": 0.98
+        "gesture_type": gesture_type,
+        "confidence": confidence
     }
 
 @router.post("/solve")
@@ -1,26 +1,44 @@
+import asyncio
+import os
+from typing import Literal
+from uuid import UUID
+
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
-import os
+
+from app.services.export_service import EXPORT_MEDIA_TYPES, ExportService
 
 router = APIRouter()
 
 class ExportRequest(BaseModel):
-    project_id: str
-    format: str  # "glb" or "stl"
+    project_id: UUID
+    format: Literal["glb", "stl"]
 
-@router.post("/")
+@router.post("/", status_code=202)
 async def start_export(payload: ExportRequest):
-    # In a real app, this might trigger a background Celery task
-    # For now, we return a placeholder success
+    # Tessellation runs on the Celery cpu queue; the task id doubles as export id
+    from celery_app import generate_export
+
+    task = generate_export.delay(str(payload.project_id), payload.format)
     return {
         "status": "processing",
-        "export_id": "exp_12345",
+        "export_id": task.id,
         "message": f"Generating {payload.format} for project {payload.project_id}"
     }
 
 @router.get("/download/{export_id}")
-async def download_export(export_id: str):
-    # Logic to fetch and return the exported file from storage
-    # Placeholder return
-    return {"message": "File ready for download (placeholder)"}
+async def download_export(export_id: UUID):
+    export = ExportService.find_export(str(export_id))
+    if export is None:
+        raise HTTPException(status_code=404, detail="Export not found or still processing")
+
+    path, fmt = export
+    # Reuse the stat so FileResponse doesn't stat the file again
+    stat_result = await asyncio.to_thread(os.stat, path)
+    return FileResponse(
+        path,
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        filename=os.path.basename(path),
+        stat_result=stat_result,
+    )
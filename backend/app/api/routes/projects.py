@@ -1,37 +1,67 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+import msgspec
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, WebSocket, WebSocketDisconnect, status
 from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.cache import etag_matches
 from app.core.database import get_session
-from app.models.project import Project, ProjectCreate, ProjectUpdate
+from app.models.project import Project, ProjectCreate, ProjectCreateMsg, ProjectSummary, ProjectUpdate
 from app.services.project_service import ProjectService
+from app.websocket.checkpoints import scene_checkpoints
+from app.websocket.manager import manager
 
 router = APIRouter()
 
-@router.post("/", response_model=Project, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/",
+    response_model=Project,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": ProjectCreate.model_json_schema()}},
+        }
+    },
+)
 async def create_project(
-    project_in: ProjectCreate, 
+    request: Request,
     session: AsyncSession = Depends(get_session)
 ):
+    # Decode + validate in msgspec's C core instead of going through Pydantic
+    try:
+        project_in = msgspec.json.decode(await request.body(), type=ProjectCreateMsg)
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
     return await ProjectService.create_project(session, project_in)
 
-@router.get("/", response_model=List[Project])
+@router.get("/", response_model=List[ProjectSummary])
 async def read_projects(
-    skip: int = 0, 
+    before: Optional[datetime] = None,
+    before_id: Optional[UUID] = None,
     limit: int = 100, 
     session: AsyncSession = Depends(get_session)
 ):
-    return await ProjectService.get_projects(session, skip, limit)
+    # Next page: the last item's updated_at and id as before/before_id
+    return await ProjectService.get_projects(session, before, limit, before_id)
 
 @router.get("/{project_id}", response_model=Project)
 async def read_project(
     project_id: UUID, 
+    request: Request,
     session: AsyncSession = Depends(get_session)
 ):
-    project = await ProjectService.get_project(session, project_id)
-    if not project:
+    cached = await ProjectService.get_project_cached(session, project_id)
+    if not cached:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project
+
+    etag, body = cached
+    headers = {"ETag": f'"{etag}"'}
+    if etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    # Already serialized; skip response_model validation and re-encoding
+    return Response(content=body, media_type="application/json", headers=headers)
 
 @router.patch("/{project_id}", response_model=Project)
 async def update_project(
@@ -53,3 +83,33 @@ async def delete_project(
     if not success:
         raise HTTPException(status_code=404, detail="Project not found")
     return None
+
+@router.websocket("/{project_id}/ws")
+async def project_socket(
+    websocket: WebSocket,
+    project_id: UUID,
+    session: AsyncSession = Depends(get_session)
+):
+    # Checkpoints reference project.id; refuse rooms for projects that don't exist
+    if not await ProjectService.project_exists(session, project_id):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    room = str(project_id)
+    await manager.connect(websocket, room)
+    try:
+        while True:
+            delta = await websocket.receive_text()
+            try:
+                orjson.loads(delta)
+            except orjson.JSONDecodeError:
+                # Malformed frames are neither checkpointed nor relayed
+                continue
+            # Checkpoints are debounced and COPY'd in batches, not written per message
+            scene_checkpoints.add(project_id, delta.encode())
+            # Relay the client's frame as-is instead of re-encoding it
+            await manager.broadcast_frame(delta, room, exclude=websocket)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        manager.disconnect(websocket, room)
@@ -0,0 +1,32 @@
+import hashlib
+import os
+from datetime import datetime
+
+import redis.asyncio as redis
+
+# Same Redis instance Celery uses as its broker
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+redis_client = redis.from_url(REDIS_URL)
+
+PROJECT_CACHE_TTL = 300
+
+
+def project_cache_key(project_id) -> str:
+    return f"proj:{project_id}"
+
+
+def project_etag(updated_at: datetime) -> str:
+    return hashlib.blake2b(str(updated_at).encode(), digest_size=8).hexdigest()
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match list of entity tags (or ``*``) against ``etag``."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == f'"{etag}"':
+            return True
+    return False
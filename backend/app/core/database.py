@@ -1,18 +1,41 @@
+from typing import AsyncGenerator
+
 from sqlmodel import SQLModel, create_engine
-from sqlmodel.ext.asyncio.session import AsyncEngine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
 from app.core.config import settings
 
-engine = AsyncEngine(create_engine(settings.DATABASE_URL, echo=True))
+# Statement caching knobs only exist on the asyncpg driver
+_connect_args = (
+    {
+        "prepared_statement_cache_size": 512,
+        "statement_cache_size": 1024,
+        "server_settings": {"jit": "off"},
+    }
+    if settings.DATABASE_URL.startswith("postgresql+asyncpg")
+    else {}
+)
+
+engine = AsyncEngine(
+    create_engine(
+        settings.DATABASE_URL,
+        echo=True,
+        query_cache_size=1200,
+        connect_args=_connect_args,
+    )
+)
+
+async_session = async_sessionmaker(
+    engine, class_=AsyncSession, expire_on_commit=False
+)
 
 async def init_db():
+    from app.models import project, scene_version  # noqa: F401  # register tables on metadata
+
     async with engine.begin() as conn:
         # await conn.run_sync(SQLModel.metadata.drop_all)
         await conn.run_sync(SQLModel.metadata.create_all)
 
-async def get_session() -> AsyncSession:
-    async_session = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
         yield session
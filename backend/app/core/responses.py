@@ -0,0 +1,27 @@
+from typing import Any
+
+import numpy as np
+import orjson
+from fastapi.responses import JSONResponse
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    # OPT_SERIALIZE_NUMPY only covers C-contiguous arrays of native dtypes
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson, with UUID/datetime/numpy handled natively."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -3,11 +3,15 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.routes import projects, ai, export
 from app.core.config import settings
 from app.core.database import init_db
+from app.core.responses import ORJSONResponse
+from app.ml.gesture_engine import load_gesture_engine
+from app.rpc.server import GRPC_IN_PROCESS, start_grpc_server
 
 app = FastAPI(
     title="MotionMath AI Backend",
     version="2.0.0",
-    description="Architecture-focused CAD & Spatial Computing Engine"
+    description="Architecture-focused CAD & Spatial Computing Engine",
+    default_response_class=ORJSONResponse,
 )
 
 # Set CORS
@@ -27,7 +31,37 @@ app.include_router(export.router, prefix="/api/export", tags=["export"])
 @app.on_event("startup")
 async def on_startup():
     await init_db()
+    app.state.trt = load_gesture_engine()
+    # Streaming gesture path for realtime clients; REST /api/ai/recognize stays.
+    # Normally its own process (python -m app.rpc.server); in-process only for a single worker
+    app.state.grpc = await start_grpc_server(app.state.trt) if GRPC_IN_PROCESS else None
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    if app.state.grpc is not None:
+        await app.state.grpc.stop(grace=5)
+    if app.state.trt is not None:
+        app.state.trt.close()
 
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "engine": "FastAPI 2.0"}
+
+if __name__ == "__main__":
+    import os
+
+    import uvicorn
+    import uvloop
+
+    uvloop.install()
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=os.cpu_count() or 1,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        ws_max_size=16 * 1024 * 1024,
+        backlog=4096,
+    )
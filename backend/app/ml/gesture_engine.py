@@ -0,0 +1,161 @@
+"""
+TensorRT runtime for the hand-gesture classifier.
+
+The engine is built offline from the exported ONNX graph, FP16 by default:
+
+    trtexec --onnx=gesture.onnx --fp16 --saveEngine=gesture.engine
+
+or INT8 when a calibration cache is available:
+
+    trtexec --onnx=gesture.onnx --int8 --calib=calib.cache --saveEngine=gesture.engine
+
+Engines are tied to the GPU architecture they were built on, so
+scripts/build_gesture_engines.sh produces one ``gesture.sm<major><minor>.engine``
+per deployment SM; the matching one is picked at startup, falling back to
+``GESTURE_ENGINE_PATH``.
+
+The engine is deserialized once per worker at startup; every request reuses
+the same execution context, CUDA stream and pinned/device buffers. Because
+those are shared, async callers go through ``classify_async``, which runs
+inference on one dedicated thread, off the event loop and one pass at a time.
+"""
+
+import asyncio
+import logging
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+import numpy as np
+
+from app.ml.preprocess import normalize
+
+try:
+    import tensorrt as trt
+    import pycuda.driver as cuda
+except ImportError:  # GPU runtime not installed on this host
+    trt = None
+    cuda = None
+
+logger = logging.getLogger(__name__)
+
+GESTURE_ENGINE_PATH = os.getenv("GESTURE_ENGINE_PATH", "models/gesture.engine")
+
+# Output index -> label, in the order the classifier head was trained with
+GESTURE_LABELS = ("none", "pinch", "grab", "point", "open_palm", "fist", "swipe")
+
+NUM_LANDMARKS = 21
+
+
+class GestureEngine:
+    """Cached TensorRT execution context for (1, 21, 3) landmark batches."""
+
+    def __init__(self, engine_path: str, device_id: int = 0):
+        cuda.init()
+        # A dedicated context lets us push/pop around each call regardless of
+        # which thread the request lands on.
+        self._cuda_ctx = cuda.Device(device_id).make_context()
+        try:
+            runtime = trt.Runtime(trt.Logger(trt.Logger.WARNING))
+            # Deserialize straight from the page cache instead of reading into a bytes copy
+            with open(engine_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                self._engine = runtime.deserialize_cuda_engine(buf)
+            self._context = self._engine.create_execution_context()
+            self._stream = cuda.Stream()
+
+            names = [self._engine.get_tensor_name(i) for i in range(self._engine.num_io_tensors)]
+            self._input_name = next(
+                n for n in names if self._engine.get_tensor_mode(n) == trt.TensorIOMode.INPUT
+            )
+            self._output_name = next(
+                n for n in names if self._engine.get_tensor_mode(n) == trt.TensorIOMode.OUTPUT
+            )
+
+            input_shape = tuple(self._engine.get_tensor_shape(self._input_name))
+            output_shape = tuple(self._engine.get_tensor_shape(self._output_name))
+
+            self._host_input = cuda.pagelocked_empty(input_shape, dtype=np.float32)
+            self._host_output = cuda.pagelocked_empty(output_shape, dtype=np.float32)
+            self._device_input = cuda.mem_alloc(self._host_input.nbytes)
+            self._device_output = cuda.mem_alloc(self._host_output.nbytes)
+
+            self._context.set_tensor_address(self._input_name, int(self._device_input))
+            self._context.set_tensor_address(self._output_name, int(self._device_output))
+        finally:
+            self._cuda_ctx.pop()
+
+        # Single worker: serializes use of the shared buffers and context
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gesture-trt")
+
+    @property
+    def input_buffer(self) -> np.ndarray:
+        """(21, 3) view of the pinned input buffer, for writing preprocessed landmarks in place."""
+        return self._host_input.reshape(NUM_LANDMARKS, 3)
+
+    def infer(self, landmarks: Optional[np.ndarray] = None) -> Tuple[int, float]:
+        """Run one forward pass and return (class index, softmax confidence).
+
+        Without ``landmarks`` the current contents of ``input_buffer`` are used.
+        """
+        if landmarks is not None:
+            np.copyto(self._host_input, landmarks.reshape(self._host_input.shape))
+
+        self._cuda_ctx.push()
+        try:
+            cuda.memcpy_htod_async(self._device_input, self._host_input, self._stream)
+            self._context.execute_async_v3(self._stream.handle)
+            cuda.memcpy_dtoh_async(self._host_output, self._device_output, self._stream)
+            self._stream.synchronize()
+        finally:
+            self._cuda_ctx.pop()
+
+        logits = self._host_output.reshape(-1)
+        exp = np.exp(logits - logits.max())
+        probs = exp / exp.sum()
+        index = int(probs.argmax())
+        return index, float(probs[index])
+
+    def classify(self, landmarks: np.ndarray) -> Tuple[str, float]:
+        """Normalize a (21, 3) landmark array and return (gesture label, confidence)."""
+        # Normalize straight into the pinned input buffer, then run
+        normalize(landmarks, self.input_buffer)
+        index, confidence = self.infer()
+        return GESTURE_LABELS[index], confidence
+
+    async def classify_async(self, landmarks: np.ndarray) -> Tuple[str, float]:
+        """``classify`` on the engine's inference thread, without blocking the event loop."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.classify, landmarks)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        self._cuda_ctx.push()
+        try:
+            self._device_input.free()
+            self._device_output.free()
+            del self._context
+            del self._engine
+        finally:
+            self._cuda_ctx.pop()
+            self._cuda_ctx.detach()
+
+
+def _engine_path_for_device(device_id: int = 0) -> str:
+    """Prefer the engine built for this GPU's SM version, e.g. gesture.sm86.engine."""
+    major, minor = cuda.Device(device_id).compute_capability()
+    per_sm = os.path.join(os.path.dirname(GESTURE_ENGINE_PATH), f"gesture.sm{major}{minor}.engine")
+    return per_sm if os.path.exists(per_sm) else GESTURE_ENGINE_PATH
+
+
+def load_gesture_engine(engine_path: Optional[str] = None) -> Optional[GestureEngine]:
+    """Load the engine, or return None when TensorRT or the engine file is missing."""
+    if trt is None or cuda is None:
+        logger.warning("TensorRT/PyCUDA not installed; gesture inference disabled")
+        return None
+    if engine_path is None:
+        cuda.init()
+        engine_path = _engine_path_for_device()
+    if not os.path.exists(engine_path):
+        logger.warning(f"Gesture engine not found at {engine_path}; gesture inference disabled")
+        return None
+    return GestureEngine(engine_path)
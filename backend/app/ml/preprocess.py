@@ -0,0 +1,71 @@
+"""
+Hand-landmark normalization applied before gesture inference.
+
+Landmarks are translated to the wrist, scaled by the wrist -> middle-MCP
+distance and rotated into a canonical palm frame, so the classifier sees the
+same pose regardless of hand position, distance to camera and roll.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # fall back to plain Python; same results, just slower
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+WRIST = 0
+INDEX_MCP = 5
+MIDDLE_MCP = 9
+PINKY_MCP = 17
+
+
+@njit(cache=True, fastmath=True)
+def normalize(landmarks: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Normalize a (21, 3) float32 array into ``out`` (may be a pinned buffer)."""
+    n = landmarks.shape[0]
+    for i in range(n):
+        for k in range(3):
+            out[i, k] = landmarks[i, k] - landmarks[WRIST, k]
+
+    # y axis: wrist -> middle finger MCP; its length is the scale
+    scale = np.sqrt(out[MIDDLE_MCP, 0] ** 2 + out[MIDDLE_MCP, 1] ** 2 + out[MIDDLE_MCP, 2] ** 2)
+    if scale == 0.0:
+        return out
+    y0 = out[MIDDLE_MCP, 0] / scale
+    y1 = out[MIDDLE_MCP, 1] / scale
+    y2 = out[MIDDLE_MCP, 2] / scale
+
+    # x axis: pinky MCP -> index MCP, made orthogonal to y (Gram-Schmidt)
+    a0 = out[INDEX_MCP, 0] - out[PINKY_MCP, 0]
+    a1 = out[INDEX_MCP, 1] - out[PINKY_MCP, 1]
+    a2 = out[INDEX_MCP, 2] - out[PINKY_MCP, 2]
+    d = a0 * y0 + a1 * y1 + a2 * y2
+    x0 = a0 - d * y0
+    x1 = a1 - d * y1
+    x2 = a2 - d * y2
+    x_norm = np.sqrt(x0 * x0 + x1 * x1 + x2 * x2)
+    if x_norm == 0.0:
+        for i in range(n):
+            for k in range(3):
+                out[i, k] /= scale
+        return out
+    x0 /= x_norm
+    x1 /= x_norm
+    x2 /= x_norm
+
+    # z axis: palm normal
+    z0 = x1 * y2 - x2 * y1
+    z1 = x2 * y0 - x0 * y2
+    z2 = x0 * y1 - x1 * y0
+
+    for i in range(n):
+        p0 = out[i, 0]
+        p1 = out[i, 1]
+        p2 = out[i, 2]
+        out[i, 0] = (p0 * x0 + p1 * x1 + p2 * x2) / scale
+        out[i, 1] = (p0 * y0 + p1 * y1 + p2 * y2) / scale
+        out[i, 2] = (p0 * z0 + p1 * z1 + p2 * z2) / scale
+    return out
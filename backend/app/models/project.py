@@ -1,23 +1,51 @@
 from datetime import datetime
 from typing import Optional, List, Dict, Any
+import msgspec
+from pydantic import ConfigDict
 from sqlmodel import SQLModel, Field, Column, JSON
+from sqlalchemy import Index
+from sqlalchemy.dialects.postgresql import JSONB
 from uuid import UUID, uuid4
 
 class ProjectBase(SQLModel):
+    model_config = ConfigDict(from_attributes=True)
+
     name: str
     description: Optional[str] = None
-    scene_data: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
+    scene_data: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON().with_variant(JSONB(), "postgresql")))
 
 class Project(ProjectBase, table=True):
+    __table_args__ = (
+        Index("ix_project_scene_gin", "scene_data", postgresql_using="gin"),
+        Index("ix_project_updated_at", "updated_at", "id"),
+    )
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     owner_id: Optional[str] = None
 
+class ProjectSummary(SQLModel):
+    id: UUID
+    name: str
+    updated_at: datetime
+
 class ProjectCreate(ProjectBase):
     pass
 
+class ProjectCreateMsg(msgspec.Struct, frozen=True):
+    """Hot-path decoder for POST /projects; ProjectCreate remains the OpenAPI schema."""
+    name: str
+    description: Optional[str] = None
+    scene_data: Dict[str, Any] = {}
+
 class ProjectUpdate(SQLModel):
     name: Optional[str] = None
     description: Optional[str] = None
     scene_data: Optional[Dict[str, Any]] = None
+
+# Build the validators at import time rather than on the first request
+Project.model_rebuild()
+ProjectSummary.model_rebuild()
+ProjectCreate.model_rebuild()
+ProjectUpdate.model_rebuild()
@@ -0,0 +1,19 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import BigInteger, ForeignKey, Identity, LargeBinary, Uuid
+from sqlmodel import SQLModel, Field, Column
+
+class SceneVersion(SQLModel, table=True):
+    """Append-only scene checkpoint; written in bulk via COPY."""
+
+    __tablename__ = "scene_versions"
+
+    # (project_id, ts, seq) doubles as the history index, scanned backwards for newest-first;
+    # seq breaks ties between deltas stamped with the same ts
+    project_id: UUID = Field(
+        sa_column=Column(Uuid, ForeignKey("project.id", ondelete="CASCADE"), primary_key=True)
+    )
+    ts: datetime = Field(primary_key=True)
+    seq: int = Field(sa_column=Column(BigInteger, Identity(), primary_key=True))
+    blob: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
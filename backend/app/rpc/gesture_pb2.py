@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: app/rpc/gesture.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'app/rpc/gesture.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x15\x61pp/rpc/gesture.proto\x12\x12motionmath.gesture\"G\n\rLandmarkFrame\x12\x11\n\tlandmarks\x18\x01 \x03(\x02\x12\x11\n\thand_side\x18\x02 \x01(\t\x12\x10\n\x08\x66rame_id\x18\x03 \x01(\x04\"E\n\x07Gesture\x12\x14\n\x0cgesture_type\x18\x01 \x01(\t\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12\x10\n\x08\x66rame_id\x18\x03 \x01(\x04\x32\x64\n\x11GestureRecognizer\x12O\n\tRecognize\x12!.motionmath.gesture.LandmarkFrame\x1a\x1b.motionmath.gesture.Gesture(\x01\x30\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'app.rpc.gesture_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_LANDMARKFRAME']._serialized_start=45
+  _globals['_LANDMARKFRAME']._serialized_end=116
+  _globals['_GESTURE']._serialized_start=118
+  _globals['_GESTURE']._serialized_end=187
+  _globals['_GESTURERECOGNIZER']._serialized_start=189
+  _globals['_GESTURERECOGNIZER']._serialized_end=289
+# @@protoc_insertion_point(module_scope)
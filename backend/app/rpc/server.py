@@ -0,0 +1,75 @@
+"""
+Bidirectional gesture-recognition stream over gRPC.
+
+GRPC_PORT can only be bound once per host. Run the server as its own
+process (``python -m app.rpc.server``), which is the default. Set
+GRPC_IN_PROCESS=1 to start it from the FastAPI startup hook instead, but
+only for single-worker deployments: with ``uvicorn --workers N`` every
+worker would try to bind the same port.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Optional
+
+import grpc
+import numpy as np
+
+from app.ml.gesture_engine import NUM_LANDMARKS, GestureEngine, load_gesture_engine
+from app.rpc import gesture_pb2, gesture_pb2_grpc
+
+logger = logging.getLogger(__name__)
+
+GRPC_PORT = int(os.getenv("GRPC_PORT", "50051"))
+GRPC_IN_PROCESS = os.getenv("GRPC_IN_PROCESS", "0") == "1"
+
+
+class GestureRecognizerServicer(gesture_pb2_grpc.GestureRecognizerServicer):
+    def __init__(self, engine: Optional[GestureEngine]):
+        self._engine = engine
+
+    async def Recognize(self, request_iterator, context):
+        if self._engine is None:
+            await context.abort(grpc.StatusCode.UNAVAILABLE, "Gesture engine unavailable")
+
+        async for frame in request_iterator:
+            if len(frame.landmarks) != NUM_LANDMARKS * 3:
+                await context.abort(
+                    grpc.StatusCode.INVALID_ARGUMENT, "Expected 21 landmarks of (x, y, z)"
+                )
+            landmarks = np.asarray(frame.landmarks, dtype=np.float32).reshape(NUM_LANDMARKS, 3)
+            # Inference runs on the engine's thread so one stream can't stall the loop
+            gesture_type, confidence = await self._engine.classify_async(landmarks)
+            yield gesture_pb2.Gesture(
+                gesture_type=gesture_type, confidence=confidence, frame_id=frame.frame_id
+            )
+
+
+async def start_grpc_server(engine: Optional[GestureEngine], port: int = GRPC_PORT) -> grpc.aio.Server:
+    """Start the gRPC server on the running event loop."""
+    server = grpc.aio.server()
+    gesture_pb2_grpc.add_GestureRecognizerServicer_to_server(
+        GestureRecognizerServicer(engine), server
+    )
+    server.add_insecure_port(f"[::]:{port}")
+    await server.start()
+    logger.info(f"gRPC gesture server listening on port {port}")
+    return server
+
+
+async def serve() -> None:
+    """Standalone entry point: one process owns the port and the engine."""
+    engine = load_gesture_engine()
+    server = await start_grpc_server(engine)
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(grace=5)
+        if engine is not None:
+            engine.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(serve())
@@ -0,0 +1,210 @@
+"""
+Scene -> GLB/STL export.
+
+``scene_data["objects"]`` is a list of primitives:
+
+    {"type": "box", "position": [x, y, z], "scale": [sx, sy, sz]}
+    {"type": "sphere", "position": [x, y, z], "radius": r}
+    {"type": "mesh", "position": [x, y, z], "scale": s, "vertices": [[x, y, z], ...], "faces": [[i, j, k], ...]}
+
+Every primitive of a kind is tessellated in one batched array expression
+(template broadcast over N instances), on the GPU when CuPy is available.
+"""
+
+import json
+import os
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import cupy as xp
+except ImportError:  # CPU-only host
+    xp = np
+
+EXPORT_DIR = os.getenv("EXPORT_DIR", "/tmp/exports")
+
+EXPORT_MEDIA_TYPES = {
+    "glb": "model/gltf-binary",
+    "stl": "model/stl",
+}
+
+SPHERE_SEGMENTS = 32
+SPHERE_RINGS = 16
+
+_BOX_VERTICES = np.array(
+    [[x, y, z] for x in (-0.5, 0.5) for y in (-0.5, 0.5) for z in (-0.5, 0.5)],
+    dtype=np.float32,
+)
+_BOX_FACES = np.array(
+    [
+        [0, 1, 3], [0, 3, 2], [4, 6, 7], [4, 7, 5],
+        [0, 4, 5], [0, 5, 1], [2, 3, 7], [2, 7, 6],
+        [0, 2, 6], [0, 6, 4], [1, 5, 7], [1, 7, 3],
+    ],
+    dtype=np.uint32,
+)
+
+
+def _unit_sphere(segments: int, rings: int) -> Tuple[np.ndarray, np.ndarray]:
+    theta = np.linspace(0, np.pi, rings + 1, dtype=np.float32)[:, None]
+    phi = np.linspace(0, 2 * np.pi, segments + 1, dtype=np.float32)[None, :]
+    vertices = np.stack(
+        [np.sin(theta) * np.cos(phi), np.cos(theta) * np.ones_like(phi), np.sin(theta) * np.sin(phi)],
+        axis=-1,
+    ).reshape(-1, 3)
+
+    row = np.arange(rings, dtype=np.uint32)[:, None] * (segments + 1)
+    col = np.arange(segments, dtype=np.uint32)[None, :]
+    a = (row + col).ravel()
+    b = a + segments + 1
+    faces = np.concatenate(
+        [np.stack([a, b, a + 1], axis=1), np.stack([a + 1, b, b + 1], axis=1)]
+    )
+    return vertices.astype(np.float32), faces
+
+
+_SPHERE_VERTICES, _SPHERE_FACES = _unit_sphere(SPHERE_SEGMENTS, SPHERE_RINGS)
+
+
+def _to_host(array) -> np.ndarray:
+    return array.get() if hasattr(array, "get") else np.asarray(array)
+
+
+def _instance(template_vertices, template_faces, positions, scales) -> Tuple[Any, Any]:
+    """Broadcast one template over N instances: (N, V, 3) vertices, (N, F, 3) faces."""
+    vertices = xp.asarray(template_vertices)[None] * scales[:, None] + positions[:, None]
+    offsets = xp.arange(positions.shape[0], dtype=xp.uint32) * template_vertices.shape[0]
+    faces = xp.asarray(template_faces)[None] + offsets[:, None, None]
+    return vertices.reshape(-1, 3), faces.reshape(-1, 3)
+
+
+def _scale_vector(obj: Dict[str, Any], default: float = 1.0) -> List[float]:
+    scale = obj.get("scale", default)
+    return [scale] * 3 if isinstance(scale, (int, float)) else scale
+
+
+class ExportService:
+    @staticmethod
+    def tessellate(scene_data: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """Flatten the scene into one (V, 3) float32 vertex and (F, 3) uint32 index array."""
+        objects = scene_data.get("objects", [])
+        parts: List[Tuple[Any, Any]] = []
+
+        boxes = [o for o in objects if o.get("type") == "box"]
+        if boxes:
+            positions = xp.asarray([o.get("position", [0, 0, 0]) for o in boxes], dtype=xp.float32)
+            scales = xp.asarray([_scale_vector(o) for o in boxes], dtype=xp.float32)
+            parts.append(_instance(_BOX_VERTICES, _BOX_FACES, positions, scales))
+
+        spheres = [o for o in objects if o.get("type") == "sphere"]
+        if spheres:
+            positions = xp.asarray([o.get("position", [0, 0, 0]) for o in spheres], dtype=xp.float32)
+            radii = xp.asarray([[o.get("radius", 1.0)] * 3 for o in spheres], dtype=xp.float32)
+            parts.append(_instance(_SPHERE_VERTICES, _SPHERE_FACES, positions, radii))
+
+        for mesh in (o for o in objects if o.get("type") == "mesh"):
+            vertices = xp.asarray(mesh["vertices"], dtype=xp.float32)
+            vertices = vertices * xp.asarray(_scale_vector(mesh), dtype=xp.float32)
+            vertices = vertices + xp.asarray(mesh.get("position", [0, 0, 0]), dtype=xp.float32)
+            parts.append((vertices, xp.asarray(mesh["faces"], dtype=xp.uint32)))
+
+        if not parts:
+            return np.zeros((0, 3), dtype=np.float32), np.zeros((0, 3), dtype=np.uint32)
+
+        vertex_offset = 0
+        all_vertices, all_faces = [], []
+        for vertices, faces in parts:
+            all_vertices.append(vertices)
+            all_faces.append(faces + vertex_offset)
+            vertex_offset += vertices.shape[0]
+
+        return (
+            _to_host(xp.concatenate(all_vertices)).astype(np.float32, copy=False),
+            _to_host(xp.concatenate(all_faces)).astype(np.uint32, copy=False),
+        )
+
+    @staticmethod
+    def write_glb(vertices: np.ndarray, faces: np.ndarray, path: str) -> None:
+        positions = vertices.tobytes()
+        indices = faces.tobytes()
+        binary = positions + indices
+        binary += b"\x00" * (-len(binary) % 4)
+
+        gltf = {
+            "asset": {"version": "2.0", "generator": "MotionMath AI"},
+            "scene": 0,
+            "scenes": [{"nodes": [0]}],
+            "nodes": [{"mesh": 0}],
+            "meshes": [{"primitives": [{"attributes": {"POSITION": 0}, "indices": 1}]}],
+            "buffers": [{"byteLength": len(binary)}],
+            "bufferViews": [
+                {"buffer": 0, "byteOffset": 0, "byteLength": len(positions), "target": 34962},
+                {"buffer": 0, "byteOffset": len(positions), "byteLength": len(indices), "target": 34963},
+            ],
+            "accessors": [
+                {
+                    "bufferView": 0,
+                    "componentType": 5126,
+                    "count": int(vertices.shape[0]),
+                    "type": "VEC3",
+                    "min": vertices.min(axis=0).tolist() if vertices.size else [0, 0, 0],
+                    "max": vertices.max(axis=0).tolist() if vertices.size else [0, 0, 0],
+                },
+                {"bufferView": 1, "componentType": 5125, "count": int(faces.size), "type": "SCALAR"},
+            ],
+        }
+        header = json.dumps(gltf, separators=(",", ":")).encode()
+        header += b" " * (-len(header) % 4)
+
+        total = 12 + 8 + len(header) + 8 + len(binary)
+        with open(path, "wb") as f:
+            f.write(struct.pack("<4sII", b"glTF", 2, total))
+            f.write(struct.pack("<I4s", len(header), b"JSON"))
+            f.write(header)
+            f.write(struct.pack("<I4s", len(binary), b"BIN\x00"))
+            f.write(binary)
+
+    @staticmethod
+    def write_stl(vertices: np.ndarray, faces: np.ndarray, path: str) -> None:
+        triangles = vertices[faces]
+        normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        normals = np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+
+        records = np.zeros(
+            faces.shape[0],
+            dtype=[("normal", "<f4", 3), ("vertices", "<f4", (3, 3)), ("attr", "<u2")],
+        )
+        records["normal"] = normals
+        records["vertices"] = triangles
+
+        with open(path, "wb") as f:
+            f.write(b"MotionMath AI".ljust(80, b"\x00"))
+            f.write(struct.pack("<I", faces.shape[0]))
+            f.write(records.tobytes())
+
+    @staticmethod
+    def export_scene(scene_data: Dict[str, Any], fmt: str, export_id: str) -> str:
+        """Tessellate the scene and write it under EXPORT_DIR; returns the file path."""
+        if fmt not in EXPORT_MEDIA_TYPES:
+            raise ValueError(f"Unsupported export format: {fmt}")
+
+        vertices, faces = ExportService.tessellate(scene_data)
+        os.makedirs(EXPORT_DIR, exist_ok=True)
+        path = os.path.join(EXPORT_DIR, f"{export_id}.{fmt}")
+        if fmt == "glb":
+            ExportService.write_glb(vertices, faces, path)
+        else:
+            ExportService.write_stl(vertices, faces, path)
+        return path
+
+    @staticmethod
+    def find_export(export_id: str) -> Optional[Tuple[str, str]]:
+        """Return (path, format) of a finished export, or None."""
+        for fmt in EXPORT_MEDIA_TYPES:
+            path = os.path.join(EXPORT_DIR, f"{export_id}.{fmt}")
+            if os.path.exists(path):
+                return path, fmt
+        return None
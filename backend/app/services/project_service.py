@@ -1,53 +1,140 @@
-from typing import List, Optional
-from uuid import UUID
+import logging
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID, uuid4
+import msgspec
+from redis.exceptions import RedisError
+from sqlalchemy import bindparam, delete, insert, tuple_, update
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
-from app.models.project import Project, ProjectCreate, ProjectUpdate
+from app.core.cache import PROJECT_CACHE_TTL, project_cache_key, project_etag, redis_client
+from app.core.responses import dumps
+from app.models.project import Project, ProjectCreateMsg, ProjectSummary, ProjectUpdate
+
+logger = logging.getLogger(__name__)
+
+# Built once; every lookup reuses the same cached compiled statement
+_get_project_stmt = select(Project).where(Project.id == bindparam("project_id"))
+_project_exists_stmt = select(Project.id).where(Project.id == bindparam("project_id"))
 
 class ProjectService:
     @staticmethod
-    async def create_project(session: AsyncSession, project_in: ProjectCreate) -> Project:
-        db_project = Project.from_orm(project_in)
-        session.add(db_project)
+    async def create_project(session: AsyncSession, project_in: ProjectCreateMsg) -> Project:
+        now = datetime.utcnow()
+        # One INSERT ... RETURNING instead of INSERT + refresh SELECT
+        statement = (
+            insert(Project)
+            .values(**msgspec.structs.asdict(project_in), id=uuid4(), created_at=now, updated_at=now)
+            .returning(Project)
+        )
+        result = await session.execute(statement)
+        db_project = result.scalar_one()
         await session.commit()
-        await session.refresh(db_project)
         return db_project
 
     @staticmethod
     async def get_project(session: AsyncSession, project_id: UUID) -> Optional[Project]:
-        statement = select(Project).where(Project.id == project_id)
-        result = await session.execute(statement)
+        result = await session.execute(_get_project_stmt, {"project_id": project_id})
         return result.scalar_one_or_none()
 
     @staticmethod
-    async def get_projects(session: AsyncSession, skip: int = 0, limit: int = 100) -> List[Project]:
-        statement = select(Project).offset(skip).limit(limit)
+    async def project_exists(session: AsyncSession, project_id: UUID) -> bool:
+        result = await session.execute(_project_exists_stmt, {"project_id": project_id})
+        return result.first() is not None
+
+    @staticmethod
+    async def get_project_cached(
+        session: AsyncSession, project_id: UUID
+    ) -> Optional[Tuple[str, bytes]]:
+        """Return (etag, serialized project), served from Redis when possible."""
+        key = project_cache_key(project_id)
+        # Redis is only a cache; when it is down, serve straight from the database
+        try:
+            etag, body = await redis_client.hmget(key, "etag", "body")
+            if body is not None:
+                return etag.decode(), body
+        except RedisError as e:
+            logger.warning(f"Project cache read failed for {project_id}: {e}")
+
+        db_project = await ProjectService.get_project(session, project_id)
+        if not db_project:
+            return None
+
+        etag = project_etag(db_project.updated_at)
+        body = dumps(db_project.model_dump())
+        try:
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping={"etag": etag, "body": body})
+                pipe.expire(key, PROJECT_CACHE_TTL)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Project cache write failed for {project_id}: {e}")
+        return etag, body
+
+    @staticmethod
+    async def _invalidate(project_id: UUID) -> None:
+        try:
+            await redis_client.delete(project_cache_key(project_id))
+        except RedisError as e:
+            # The entry still expires after PROJECT_CACHE_TTL
+            logger.error(f"Failed to invalidate project cache for {project_id}: {e}")
+
+    @staticmethod
+    async def get_projects(
+        session: AsyncSession,
+        before: Optional[datetime] = None,
+        limit: int = 100,
+        before_id: Optional[UUID] = None,
+    ) -> List[ProjectSummary]:
+        # Only the columns the list view needs; scene_data can be megabytes
+        statement = select(Project.id, Project.name, Project.updated_at)
+        # Keyset pagination: walk ix_project_updated_at instead of OFFSET scans;
+        # id breaks ties so projects sharing the boundary updated_at aren't skipped
+        if before is not None and before_id is not None:
+            statement = statement.where(tuple_(Project.updated_at, Project.id) < tuple_(before, before_id))
+        elif before is not None:
+            statement = statement.where(Project.updated_at < before)
+        statement = statement.order_by(Project.updated_at.desc(), Project.id.desc()).limit(limit)
         result = await session.execute(statement)
-        return result.scalars().all()
+        return [ProjectSummary(**row._mapping) for row in result.all()]
 
     @staticmethod
     async def update_project(
         session: AsyncSession, project_id: UUID, project_in: ProjectUpdate
     ) -> Optional[Project]:
-        db_project = await ProjectService.get_project(session, project_id)
-        if not db_project:
-            return None
-        
-        project_data = project_in.dict(exclude_unset=True)
-        for key, value in project_data.items():
-            setattr(db_project, key, value)
-        
-        session.add(db_project)
+        project_data = project_in.model_dump(exclude_unset=True)
+        statement = (
+            update(Project)
+            .where(Project.id == project_id)
+            .values(**project_data, updated_at=datetime.utcnow())
+            .returning(Project)
+        )
+        result = await session.execute(statement)
+        db_project = result.scalar_one_or_none()
         await session.commit()
-        await session.refresh(db_project)
+        await ProjectService._invalidate(project_id)
         return db_project
 
     @staticmethod
     async def delete_project(session: AsyncSession, project_id: UUID) -> bool:
-        db_project = await ProjectService.get_project(session, project_id)
-        if not db_project:
-            return False
-        
-        await session.delete(db_project)
+        statement = delete(Project).where(Project.id == project_id).returning(Project.id)
+        result = await session.execute(statement)
+        deleted = result.first() is not None
+        await session.commit()
+        if deleted:
+            await ProjectService._invalidate(project_id)
+        return deleted
+
+    @staticmethod
+    async def bulk_insert_scene_versions(
+        session: AsyncSession, rows: Sequence[Tuple[UUID, datetime, bytes]]
+    ) -> None:
+        """Write (project_id, ts, blob) checkpoints with a single binary COPY; seq is assigned by the database."""
+        if not rows:
+            return
+        connection = await session.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            "scene_versions", records=rows, columns=("project_id", "ts", "blob")
+        )
         await session.commit()
-        return True
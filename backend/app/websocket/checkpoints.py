@@ -0,0 +1,48 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.core.database import async_session
+from app.services.project_service import ProjectService
+
+logger = logging.getLogger(__name__)
+
+# Scene deltas arriving within this window are written in one COPY
+FLUSH_INTERVAL = 0.25
+
+class SceneCheckpointBuffer:
+    def __init__(self, interval: float = FLUSH_INTERVAL):
+        self.interval = interval
+        self._rows: List[Tuple[UUID, datetime, bytes]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def add(self, project_id: UUID, blob: bytes):
+        self._rows.append((project_id, datetime.utcnow(), blob))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.interval)
+        rows, self._rows = self._rows, []
+        self._flush_task = None
+        try:
+            async with async_session() as session:
+                await ProjectService.bulk_insert_scene_versions(session, rows)
+            return
+        except Exception as e:
+            logger.warning(f"Batched write of {len(rows)} scene checkpoints failed, retrying per project: {e}")
+
+        # One bad room (e.g. its project was deleted) must not cost every other room its checkpoints
+        by_project: Dict[UUID, List[Tuple[UUID, datetime, bytes]]] = {}
+        for row in rows:
+            by_project.setdefault(row[0], []).append(row)
+        for project_id, project_rows in by_project.items():
+            try:
+                async with async_session() as session:
+                    await ProjectService.bulk_insert_scene_versions(session, project_rows)
+            except Exception as e:
+                logger.error(f"Failed to write {len(project_rows)} scene checkpoints for project {project_id}: {e}")
+
+scene_checkpoints = SceneCheckpointBuffer()
@@ -1,26 +1,68 @@
-from typing import Dict, List, Any
+import asyncio
+from typing import Dict, Any, Optional
+
+import orjson
 from fastapi import WebSocket
 
+# Frames buffered per client; a slow client loses its oldest frames beyond this
+SEND_QUEUE_SIZE = 64
+
 class ConnectionManager:
     def __init__(self):
-        # Maps project_id to list of active websockets
-        self.active_connections: Dict[str, List[WebSocket]] = {}
+        # Maps project_id to active websockets and their outbound frame queues
+        # (dict keeps O(1) add/remove)
+        self.active_connections: Dict[str, Dict[WebSocket, asyncio.Queue]] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
 
     async def connect(self, websocket: WebSocket, project_id: str):
         await websocket.accept()
-        if project_id not in self.active_connections:
-            self.active_connections[project_id] = []
-        self.active_connections[project_id].append(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self.active_connections.setdefault(project_id, {})[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(
+            self._writer(websocket, queue, project_id)
+        )
 
     def disconnect(self, websocket: WebSocket, project_id: str):
-        if project_id in self.active_connections:
-            self.active_connections[project_id].remove(websocket)
-            if not self.active_connections[project_id]:
+        connections = self.active_connections.get(project_id)
+        if connections is not None:
+            # Dropping the queue discards whatever was still pending for this client
+            connections.pop(websocket, None)
+            if not connections:
                 del self.active_connections[project_id]
 
-    async def broadcast(self, message: Any, project_id: str):
-        if project_id in self.active_connections:
-            for connection in self.active_connections[project_id]:
-                await connection.send_json(message)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue, project_id: str):
+        try:
+            while True:
+                frame = await queue.get()
+                await websocket.send_text(frame)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Send failed, the socket is gone
+            self.disconnect(websocket, project_id)
+
+    async def broadcast(self, message: Any, project_id: str, exclude: Optional[WebSocket] = None):
+        # Encode once for the whole room
+        await self.broadcast_frame(orjson.dumps(message).decode(), project_id, exclude)
+
+    async def broadcast_frame(self, frame: str, project_id: str, exclude: Optional[WebSocket] = None):
+        """Queue an already-encoded text frame for every client in the room."""
+        connections = self.active_connections.get(project_id)
+        if not connections:
+            return
+
+        # Per-client writers do the sending so a slow client never holds up the others
+        for websocket, queue in connections.items():
+            if websocket is exclude:
+                continue
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                queue.get_nowait()
+                queue.put_nowait(frame)
 
 manager = ConnectionManager()
@@ -0,0 +1,121 @@
+import logging
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Annotated
+
+import orjson
+from cachetools import TTLCache
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordBearer
+from jose import JWTError, jwt
+from passlib.context import CryptContext
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+
+from database import get_db
+from models import User
+from utils.security import redis_client
+
+logger = logging.getLogger(__name__)
+
+
+# Single module-level context; new hashes use Argon2id, existing bcrypt hashes still
+# verify and are upgraded on login. Costs are env-tunable so staging can run cheaper.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=int(os.getenv("ARGON2_TIME_COST", "2")),
+    argon2__memory_cost=int(os.getenv("ARGON2_MEMORY_COST", "65536")),
+    argon2__parallelism=int(os.getenv("ARGON2_PARALLELISM", "4")),
+    bcrypt__rounds=int(os.getenv("BCRYPT_ROUNDS", "12")),
+)
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+
+JWT_SECRET = os.getenv("JWT_SECRET", "changeme")
+JWT_EXPIRE_MINUTES = int(os.getenv("JWT_EXPIRE_MINUTES", "60"))
+ALGORITHM = "HS256"
+
+# Seconds an authenticated user's columns are served from Redis
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", "60"))
+
+# Per-process front for the Redis user cache, keyed by token subject
+_user_columns_cache: TTLCache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL)
+
+
+def hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Verify, and return a replacement hash when the stored one is deprecated or under-cost."""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+# Verified against on unknown-email logins so both branches cost one hash check
+DUMMY_HASH = hash_password("x" * 12)
+
+
+def create_access_token(subject: str) -> str:
+    expire = datetime.now(timezone.utc) + timedelta(minutes=JWT_EXPIRE_MINUTES)
+    to_encode = {"sub": subject, "exp": expire}
+    return jwt.encode(to_encode, JWT_SECRET, algorithm=ALGORITHM)
+
+
+async def get_current_user(
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> User:
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    try:
+        payload = jwt.decode(token, JWT_SECRET, algorithms=[ALGORITHM])
+        subject: str | None = payload.get("sub")
+        if subject is None:
+            raise credentials_exception
+    except JWTError:
+        raise credentials_exception
+
+    # Transient User built from cached columns; relationships are not loaded.
+    # In-process TTL cache first, then Redis, then the database.
+    columns = _user_columns_cache.get(subject)
+    if columns is None:
+        cache_key = f"u:{subject}"
+        # Redis is only a cache; on errors fall through to the database
+        try:
+            cached = await redis_client.get(cache_key)
+        except RedisError as e:
+            logger.warning(f"User cache read failed: {e}")
+            cached = None
+        if cached:
+            data = orjson.loads(cached)
+            columns = {
+                "id": uuid.UUID(data["id"]),
+                "name": data["name"],
+                "email": data["email"],
+                "created_at": datetime.fromisoformat(data["created_at"]),
+            }
+        else:
+            stmt = select(User.id, User.name, User.email, User.created_at).where(User.email == subject)
+            result = await db.execute(stmt)
+            row = result.first()
+            if row is None:
+                raise credentials_exception
+            columns = dict(row._mapping)
+            try:
+                await redis_client.set(cache_key, orjson.dumps(columns), ex=USER_CACHE_TTL)
+            except RedisError as e:
+                logger.warning(f"User cache write failed: {e}")
+        _user_columns_cache[subject] = columns
+    return User(**columns)
+
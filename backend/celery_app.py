@@ -6,7 +6,11 @@ This file defines all background tasks and worker configuration
 
 import os
 import logging
+import time
+import httpx
+import msgpack
 from celery import Celery
+from kombu.serialization import register
 from celery.schedules import crontab
 from datetime import datetime, timedelta
 import asyncio
@@ -20,6 +24,34 @@ logger = logging.getLogger(__name__)
 CELERY_BROKER_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
 
+# Transactional email provider endpoint (SendGrid, Postmark, ...)
+EMAIL_API_URL = os.getenv('EMAIL_API_URL')
+EMAIL_API_KEY = os.getenv('EMAIL_API_KEY', '')
+
+# msgpack task/result serialization; naive datetimes (utcnow) round-trip via an ext type
+_DATETIME_EXT_CODE = 1
+
+
+def _msgpack_default(obj):
+    if isinstance(obj, datetime):
+        return msgpack.ExtType(_DATETIME_EXT_CODE, obj.isoformat().encode())
+    raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+
+def _msgpack_ext_hook(code, data):
+    if code == _DATETIME_EXT_CODE:
+        return datetime.fromisoformat(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+register(
+    'msgpack',
+    lambda obj: msgpack.packb(obj, default=_msgpack_default, use_bin_type=True),
+    lambda payload: msgpack.unpackb(payload, ext_hook=_msgpack_ext_hook, raw=False),
+    content_type='application/x-msgpack',
+    content_encoding='binary',
+)
+
 # Create Celery app
 celery_app = Celery(
     'motionmath_worker',
@@ -30,15 +62,27 @@ celery_app = Celery(
 
 # Celery configuration
 celery_app.conf.update(
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    task_serializer='msgpack',
+    # json stays accepted while producers still on the old serializer drain
+    accept_content=['msgpack', 'json'],
+    result_serializer='msgpack',
+    result_accept_content=['msgpack', 'json'],
     timezone='UTC',
     enable_utc=True,
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
     worker_prefetch_multiplier=1,
+    # CPU-bound work (SymPy) runs on a prefork worker consuming 'cpu';
+    # network-bound tasks go to 'io', served by a gevent worker:
+    #   celery -A celery_app worker -P prefork -Q cpu
+    #   celery -A celery_app worker -P gevent -c 200 -Q io --prefetch-multiplier=4
+    task_default_queue='cpu',
+    task_routes={
+        '*.send_notification_email': {'queue': 'io'},
+        '*.health_check_*': {'queue': 'io'},
+        '*.backup_*': {'queue': 'io'},
+    },
     worker_max_tasks_per_child=1000,
     worker_disable_rate_limits=False,
     task_acks_late=True,
@@ -50,8 +94,10 @@ celery_app.conf.update(
     result_backend_transport_options={
         'master_name': 'mymaster',
         'visibility_timeout': 3600,
-        'policy': 'allkeys_lru'
+        'policy': 'allkeys_lru',
+        'global_keyprefix': 'mm:'
     },
+    redis_socket_keepalive=True,
     broker_transport_options={
         'visibility_timeout': 3600,
         'retry_policy': {
@@ -148,16 +194,17 @@ def process_math_equation(self, equation_data: Dict) -> Dict:
     try:
         logger.info(f"Processing equation: {equation_data.get('equation', 'unknown')}")
         
-        # Simulate AI processing
-        import time
-        time.sleep(2)  # Simulate processing time
+        from services.solver import solver_service
+
+        started = time.perf_counter()
+        solution, steps = solver_service.solve_generic(equation_data.get('equation', ''))
         
         result = {
             'equation': equation_data.get('equation'),
-            'solution': '42',  # Placeholder solution
-            'steps': ['Step 1: Simplify', 'Step 2: Solve', 'Step 3: Verify'],
-            'confidence': 0.95,
-            'processing_time': 2.0,
+            'solution': solution,
+            'steps': steps,
+            'confidence': equation_data.get('confidence'),
+            'processing_time': time.perf_counter() - started,
             'timestamp': datetime.utcnow().isoformat()
         }
         
@@ -168,6 +215,48 @@ def process_math_equation(self, equation_data: Dict) -> Dict:
         logger.error(f"Error processing equation: {exc}")
         raise self.retry(exc=exc, countdown=60)
 
+@celery_app.task(bind=True, max_retries=3)
+def generate_export(self, project_id: str, fmt: str) -> Dict:
+    """
+    Tessellate a project's scene and write it as GLB/STL under EXPORT_DIR
+    """
+    try:
+        logger.info(f"Generating {fmt} export for project: {project_id}")
+
+        from uuid import UUID
+        from app.core.database import async_session, engine
+        from app.services.export_service import ExportService
+        from app.services.project_service import ProjectService
+
+        async def load_scene_data() -> Optional[Dict]:
+            try:
+                async with async_session() as session:
+                    project = await ProjectService.get_project(session, UUID(project_id))
+                    return project.scene_data if project else None
+            finally:
+                # Pooled connections are bound to this task's event loop
+                await engine.dispose()
+
+        scene_data = asyncio.run(load_scene_data())
+        if scene_data is None:
+            raise ValueError(f"Project not found: {project_id}")
+
+        path = ExportService.export_scene(scene_data, fmt, self.request.id)
+
+        logger.info(f"Export written to: {path}")
+        return {
+            'project_id': project_id,
+            'format': fmt,
+            'path': path,
+            'timestamp': datetime.utcnow().isoformat()
+        }
+
+    except ValueError:
+        raise
+    except Exception as exc:
+        logger.error(f"Error generating export for project {project_id}: {exc}")
+        raise self.retry(exc=exc, countdown=60)
+
 @celery_app.task(bind=True, max_retries=3)
 def send_notification_email(self, user_email: str, notification_data: Dict) -> bool:
     """
@@ -176,11 +265,19 @@ def send_notification_email(self, user_email: str, notification_data: Dict) -> b
     try:
         logger.info(f"Sending email to: {user_email}")
         
-        # Simulate email sending
-        import time
-        time.sleep(1)
+        if not EMAIL_API_URL:
+            logger.warning(f"EMAIL_API_URL not configured, skipping email to: {user_email}")
+            return False
+
+        # Blocking socket I/O is cooperative under the gevent pool of the io worker
+        response = httpx.post(
+            EMAIL_API_URL,
+            json={'to': user_email, **notification_data},
+            headers={'Authorization': f'Bearer {EMAIL_API_KEY}'},
+            timeout=10.0,
+        )
+        response.raise_for_status()
         
-        # In production, integrate with SendGrid or similar service
         logger.info(f"Email sent successfully to: {user_email}")
         return True
         
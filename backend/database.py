@@ -1,6 +1,8 @@
+import asyncio
 import os
 from typing import AsyncGenerator
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -19,7 +21,28 @@ engine = create_async_engine(
     DATABASE_URL,
     echo=False,
     future=True,
-    pool_pre_ping=True,
+    # No per-checkout SELECT 1; stale connections are handled by server-side
+    # TCP keepalives and recycling instead
+    pool_pre_ping=False,
+    pool_recycle=1800,
+    pool_size=20,
+    max_overflow=10,
+    # Larger LRU of compiled SQL strings (default 500)
+    query_cache_size=1200,
+    connect_args={
+        # SQLAlchemy's per-connection LRU of asyncpg prepared statements
+        "prepared_statement_cache_size": 512,
+        # asyncpg's own statement cache
+        "statement_cache_size": 1024,
+        # Short OLTP queries don't benefit from JIT compilation
+        "server_settings": {
+            "jit": "off",
+            "application_name": "motionmath",
+            "tcp_keepalives_idle": "60",
+        },
+        "timeout": 10,
+        "command_timeout": 10,
+    },
 )
 
 async_session = async_sessionmaker(
@@ -45,3 +68,12 @@ async def init_db() -> None:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+
+async def warm_up_pool() -> None:
+    """Open the pool's connections once at startup so no request pays connect cost."""
+
+    async def ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping() for _ in range(engine.pool.size())))
@@ -3,14 +3,15 @@ from typing import List
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from datetime import datetime
 
 from routes import auth, equations, solve
 from schemas import HealthResponse
-from database import init_db
+from database import init_db, warm_up_pool
 from utils.logging_config import setup_logging
 from utils.security import setup_rate_limiting, limiter
+from utils.metrics import setup_metrics
 
 
 def get_cors_origins() -> List[str]:
@@ -21,11 +22,18 @@ def get_cors_origins() -> List[str]:
 # Initialize logging
 setup_logging()
 
-app = FastAPI(title="MotionMath AI Gesture Solver", version="1.0.0")
+app = FastAPI(
+    title="MotionMath AI Gesture Solver",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # Setup Rate Limiting
 setup_rate_limiting(app)
 
+# Prometheus request metrics and /metrics
+setup_metrics(app)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=get_cors_origins(),
@@ -46,6 +54,7 @@ app.mount("/ws", socket_app)
 @app.on_event("startup")
 async def on_startup() -> None:
     await init_db()
+    await warm_up_pool()
 
 
 @app.get("/health", tags=["system"], response_model=HealthResponse)
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import JSON, String, Text, Float, DateTime
+from sqlalchemy import JSON, String, Text, Float, DateTime, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -29,6 +29,16 @@ class User(Base):
 
 class Equation(Base):
     __tablename__ = "equations"
+    __table_args__ = (
+        # Per-user history in keyset order; id breaks created_at ties. The TEXT columns
+        # stay out of the index to keep entries well under the btree row size limit
+        Index(
+            "ix_equations_user_created",
+            "user_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -45,5 +55,7 @@ class Equation(Base):
         DateTime(timezone=True), default=datetime.utcnow
     )
 
-    user: Mapped["User"] = relationship("User", back_populates="equations")
+    user: Mapped["User"] = relationship(
+        "User", back_populates="equations", lazy="selectin"
+    )
 
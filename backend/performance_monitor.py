@@ -1,12 +1,16 @@
 import httpx
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
-import json
-import redis
-from prometheus_client import Counter, Histogram, Gauge, start_http_server
+import operator
+from collections import deque
+from typing import Dict, List, Optional, Any, Tuple
+from datetime import datetime
+import orjson
+import numpy as np
+import redis.asyncio as aioredis
+from prometheus_client import Gauge, start_http_server
 import psutil
+import struct
 import time
 
 # Configure logging
@@ -14,53 +18,234 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Prometheus metrics
-REQUEST_COUNT = Counter('http_requests_total', 'Total HTTP requests', ['method', 'endpoint', 'status'])
-REQUEST_DURATION = Histogram('http_request_duration_seconds', 'HTTP request duration')
 ACTIVE_CONNECTIONS = Gauge('active_connections', 'Active database connections')
 REDIS_MEMORY_USAGE = Gauge('redis_memory_usage_bytes', 'Redis memory usage')
 CPU_USAGE = Gauge('cpu_usage_percent', 'CPU usage percentage')
 MEMORY_USAGE = Gauge('memory_usage_percent', 'Memory usage percentage')
 DISK_USAGE = Gauge('disk_usage_percent', 'Disk usage percentage')
 
+# Numeric fields kept as compressed time series, by metric type
+SERIES_FIELDS = {
+    'system': {
+        'cpu': ('cpu', 'usage_percent'),
+        'memory': ('memory', 'usage_percent'),
+        'disk': ('disk', 'usage_percent'),
+    },
+    'application': {
+        'api_response_time': ('api_response_time',),
+        'error_rate': ('error_rate',),
+        'cache_hit_rate': ('cache_hit_rate',),
+        'queue_length': ('queue_length',),
+    },
+    'database': {
+        'active_connections': ('active_connections',),
+        'query_time_avg': ('query_time_avg',),
+    },
+    'redis': {
+        'hit_rate': ('hit_rate',),
+        'used_memory': ('used_memory',),
+        'ops_per_sec': ('instantaneous_ops_per_sec',),
+    },
+}
+
+# One full snapshot per minute for a day, trimmed by XADD
+STREAM_MAXLEN = 1440
+
+# (metrics index, field path, comparison, threshold, message); indexes follow
+# the (system, application, database, redis) argument order
+RECOMMENDATION_RULES = [
+    (0, ('cpu', 'usage_percent'), operator.gt, 80, "High CPU usage detected. Consider scaling up or optimizing CPU-intensive tasks."),
+    (0, ('memory', 'usage_percent'), operator.gt, 85, "High memory usage detected. Consider adding more memory or optimizing memory usage."),
+    (0, ('disk', 'usage_percent'), operator.gt, 90, "Low disk space. Consider cleaning up old files or expanding storage."),
+    (1, ('error_rate',), operator.gt, 0.05, "High error rate detected. Review error logs and fix underlying issues."),
+    (1, ('api_response_time',), operator.gt, 1.0, "Slow API response times. Consider optimizing database queries or adding caching."),
+    (2, ('active_connections',), operator.gt, 80, "High database connection count. Consider connection pooling optimization."),
+    (2, ('slow_queries',), operator.gt, 5, "Slow queries detected. Review and optimize database queries."),
+    (3, ('hit_rate',), operator.lt, 80, "Low Redis hit rate. Review caching strategy and cache keys."),
+]
+
+# (metrics index, field path, threshold, base, weight): above threshold,
+# deduct (value - base) * weight from the health score
+HEALTH_RULES = [
+    (0, ('cpu', 'usage_percent'), 80, 80, 0.5),
+    (0, ('memory', 'usage_percent'), 85, 85, 0.5),
+    (1, ('error_rate',), 0.05, 0, 100),
+    (1, ('api_response_time',), 1.0, 1.0, 10),
+]
+
+def _metric_value(metrics, idx: int, path: Tuple[str, ...]) -> Optional[float]:
+    """Nested field of metrics[idx], 0 when absent; None when that metric set is empty"""
+    value = metrics[idx] if idx < len(metrics) else None
+    if not value:
+        return None
+    for key in path:
+        value = value.get(key, 0) if isinstance(value, dict) else 0
+    return value
+
+class CompressedSeries:
+    """
+    Append-only (timestamp, float) series in a byte-aligned Gorilla encoding.
+    
+    Each record is a control byte, the zigzag varint delta-of-delta of the
+    timestamp and the non-zero bytes of the value XOR'd with the previous one.
+    A 0x80 control byte starts a fresh block with the raw timestamp and value,
+    so a restarted writer can keep appending to the same Redis string.
+    Assumes a single writer per key.
+    """
+    
+    RESET = 0x80
+    
+    def __init__(self, capacity: int = 1440):
+        self.capacity = capacity
+        self.samples = deque(maxlen=capacity)
+        self._records = 0
+        self._reset()
+    
+    def _reset(self):
+        self._prev_ts: Optional[int] = None
+        self._prev_delta = 0
+        self._prev_bits = 0
+    
+    @property
+    def should_compact(self) -> bool:
+        """The stored string holds twice the retained samples; rewrite it"""
+        return self._records > 2 * self.capacity
+    
+    def append(self, ts: int, value: float) -> bytes:
+        """Record a sample and return its encoded bytes for APPEND"""
+        self.samples.append((ts, value))
+        self._records += 1
+        return self._encode(ts, value)
+    
+    def encode_all(self) -> bytes:
+        """Re-encode the retained samples as one block for SET"""
+        self._reset()
+        self._records = len(self.samples)
+        return b''.join(self._encode(ts, value) for ts, value in self.samples)
+    
+    def _encode(self, ts: int, value: float) -> bytes:
+        bits = struct.unpack('<Q', struct.pack('<d', value))[0]
+        if self._prev_ts is None:
+            self._prev_ts, self._prev_bits = ts, bits
+            return struct.pack('<BqQ', self.RESET, ts, bits)
+        
+        delta = ts - self._prev_ts
+        dod = delta - self._prev_delta
+        self._prev_ts, self._prev_delta = ts, delta
+        
+        xor = bits ^ self._prev_bits
+        self._prev_bits = bits
+        if xor:
+            lead = (64 - xor.bit_length()) // 8
+            trail = ((xor & -xor).bit_length() - 1) // 8
+            meaningful = 8 - lead - trail
+            payload = (xor >> (8 * trail)).to_bytes(meaningful, 'little')
+        else:
+            lead, meaningful, payload = 0, 0, b''
+        
+        out = bytearray([(lead << 4) | meaningful])
+        zz = (dod << 1) ^ (dod >> 63)
+        while zz > 0x7F:
+            out.append((zz & 0x7F) | 0x80)
+            zz >>= 7
+        out.append(zz)
+        out += payload
+        return bytes(out)
+    
+    @staticmethod
+    def decode(blob: bytes) -> Tuple[np.ndarray, np.ndarray]:
+        """Decode a stored string into (epoch seconds, values) arrays"""
+        timestamps: List[int] = []
+        bits: List[int] = []
+        ts = delta = prev_bits = 0
+        pos = 0
+        
+        while pos < len(blob):
+            control = blob[pos]
+            pos += 1
+            if control == CompressedSeries.RESET:
+                ts, prev_bits = struct.unpack_from('<qQ', blob, pos)
+                pos += 16
+                delta = 0
+            else:
+                zz = shift = 0
+                while True:
+                    byte = blob[pos]
+                    pos += 1
+                    zz |= (byte & 0x7F) << shift
+                    shift += 7
+                    if byte < 0x80:
+                        break
+                delta += (zz >> 1) ^ -(zz & 1)
+                ts += delta
+                
+                lead, meaningful = control >> 4, control & 0x0F
+                if meaningful:
+                    trail = 8 - lead - meaningful
+                    prev_bits ^= int.from_bytes(blob[pos:pos + meaningful], 'little') << (8 * trail)
+                    pos += meaningful
+            timestamps.append(ts)
+            bits.append(prev_bits)
+        
+        return (
+            np.array(timestamps, dtype=np.int64),
+            np.array(bits, dtype=np.uint64).view(np.float64),
+        )
+
 class PerformanceMonitor:
     """
     Performance monitoring system for MotionMath AI
     """
     
+    # How long a Redis INFO snapshot is reused across collectors
+    INFO_CACHE_TTL = 5.0
+    
+    # One Prometheus HTTP server per process, however many monitors exist
+    _metrics_server_started = False
+    
     def __init__(self, redis_url: str = "redis://localhost:6379/0"):
-        self.redis_client = redis.from_url(redis_url)
+        self.redis_client = aioredis.from_url(redis_url, decode_responses=False)
         self.metrics_server_port = 9090
-        self.start_metrics_server()
+        self._redis_info: Optional[Dict[str, Any]] = None
+        self._series: Dict[str, CompressedSeries] = {}
+        self._redis_info_at = 0.0
+        # Prime the since-last-call CPU counter; the first reading is always 0.0
+        psutil.cpu_percent(None)
         
     def start_metrics_server(self):
         """Start Prometheus metrics server"""
+        if PerformanceMonitor._metrics_server_started:
+            return
         start_http_server(self.metrics_server_port)
+        PerformanceMonitor._metrics_server_started = True
         logger.info(f"Metrics server started on port {self.metrics_server_port}")
     
-    async def collect_system_metrics(self) -> Dict[str, Any]:
+    @staticmethod
+    def _snapshot():
+        """All blocking psutil reads, run together in one worker thread"""
+        return (
+            psutil.cpu_percent(None),
+            psutil.virtual_memory(),
+            psutil.disk_usage('/'),
+            psutil.net_io_counters(),
+            psutil.cpu_freq(),
+        )
+    
+    async def collect_system_metrics(self, store: bool = True) -> Dict[str, Any]:
         """Collect system performance metrics"""
         try:
-            # CPU metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU is measured since the previous cycle rather than sleeping for a sample
+            cpu_percent, memory, disk, network, cpu_freq = await asyncio.to_thread(self._snapshot)
             CPU_USAGE.set(cpu_percent)
-            
-            # Memory metrics
-            memory = psutil.virtual_memory()
             MEMORY_USAGE.set(memory.percent)
-            
-            # Disk metrics
-            disk = psutil.disk_usage('/')
             DISK_USAGE.set(disk.percent)
             
-            # Network metrics
-            network = psutil.net_io_counters()
-            
             metrics = {
-                'timestamp': datetime.utcnow().isoformat(),
+                'ts': time.time(),
                 'cpu': {
                     'usage_percent': cpu_percent,
                     'count': psutil.cpu_count(),
-                    'freq': psutil.cpu_freq()._asdict() if psutil.cpu_freq() else None
+                    'freq': cpu_freq._asdict() if cpu_freq else None
                 },
                 'memory': {
                     'usage_percent': memory.percent,
@@ -83,7 +268,8 @@ class PerformanceMonitor:
             }
             
             # Store metrics in Redis for time-series analysis
-            await self.store_metrics('system', metrics)
+            if store:
+                await self.store_metrics('system', metrics)
             
             return metrics
             
@@ -91,12 +277,12 @@ class PerformanceMonitor:
             logger.error(f"Error collecting system metrics: {e}")
             return {}
     
-    async def collect_application_metrics(self) -> Dict[str, Any]:
+    async def collect_application_metrics(self, store: bool = True) -> Dict[str, Any]:
         """Collect application-specific metrics"""
         try:
             # Get metrics from Redis
             app_metrics = {
-                'timestamp': datetime.utcnow().isoformat(),
+                'ts': time.time(),
                 'active_users': await self.get_active_users(),
                 'equations_processed': await self.get_equations_processed(),
                 'api_response_time': await self.get_api_response_time(),
@@ -106,7 +292,8 @@ class PerformanceMonitor:
             }
             
             # Store metrics in Redis
-            await self.store_metrics('application', app_metrics)
+            if store:
+                await self.store_metrics('application', app_metrics)
             
             return app_metrics
             
@@ -114,12 +301,12 @@ class PerformanceMonitor:
             logger.error(f"Error collecting application metrics: {e}")
             return {}
     
-    async def collect_database_metrics(self) -> Dict[str, Any]:
+    async def collect_database_metrics(self, store: bool = True) -> Dict[str, Any]:
         """Collect database performance metrics"""
         try:
             # In production, connect to actual database
             db_metrics = {
-                'timestamp': datetime.utcnow().isoformat(),
+                'ts': time.time(),
                 'active_connections': 25,  # Placeholder
                 'query_time_avg': 0.05,  # Placeholder
                 'slow_queries': 2,  # Placeholder
@@ -131,7 +318,8 @@ class PerformanceMonitor:
             ACTIVE_CONNECTIONS.set(db_metrics['active_connections'])
             
             # Store metrics in Redis
-            await self.store_metrics('database', db_metrics)
+            if store:
+                await self.store_metrics('database', db_metrics)
             
             return db_metrics
             
@@ -139,13 +327,13 @@ class PerformanceMonitor:
             logger.error(f"Error collecting database metrics: {e}")
             return {}
     
-    async def collect_redis_metrics(self) -> Dict[str, Any]:
+    async def collect_redis_metrics(self, store: bool = True) -> Dict[str, Any]:
         """Collect Redis performance metrics"""
         try:
-            info = self.redis_client.info()
+            info = await self.get_redis_info()
             
             redis_metrics = {
-                'timestamp': datetime.utcnow().isoformat(),
+                'ts': time.time(),
                 'connected_clients': info.get('connected_clients', 0),
                 'used_memory': info.get('used_memory', 0),
                 'used_memory_human': info.get('used_memory_human', '0B'),
@@ -161,7 +349,8 @@ class PerformanceMonitor:
             REDIS_MEMORY_USAGE.set(redis_metrics['used_memory'])
             
             # Store metrics in Redis
-            await self.store_metrics('redis', redis_metrics)
+            if store:
+                await self.store_metrics('redis', redis_metrics)
             
             return redis_metrics
             
@@ -169,6 +358,14 @@ class PerformanceMonitor:
             logger.error(f"Error collecting Redis metrics: {e}")
             return {}
     
+    async def get_redis_info(self) -> Dict[str, Any]:
+        """Redis INFO, reused for INFO_CACHE_TTL seconds so collectors share one call"""
+        now = time.monotonic()
+        if self._redis_info is None or now - self._redis_info_at > self.INFO_CACHE_TTL:
+            self._redis_info = await self.redis_client.info()
+            self._redis_info_at = now
+        return self._redis_info
+    
     def calculate_hit_rate(self, info: Dict) -> float:
         """Calculate Redis hit rate"""
         hits = info.get('keyspace_hits', 0)
@@ -182,17 +379,66 @@ class PerformanceMonitor:
     
     async def store_metrics(self, metric_type: str, metrics: Dict[str, Any]):
         """Store metrics in Redis for time-series analysis"""
+        await self.store_metrics_batch({metric_type: metrics})
+    
+    async def store_metrics_batch(self, batch: Dict[str, Dict[str, Any]]):
+        """Store several metric types in one pipelined round-trip"""
         try:
-            key = f"metrics:{metric_type}:{datetime.utcnow().strftime('%Y%m%d%H%M')}"
-            self.redis_client.setex(key, 86400, json.dumps(metrics))  # Keep for 24 hours
-            
-            # Also store latest metrics
-            latest_key = f"latest_metrics:{metric_type}"
-            self.redis_client.set(latest_key, json.dumps(metrics))
+            now = time.time()
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for metric_type, metrics in batch.items():
+                    if not metrics:
+                        continue
+                    ts = int(metrics.get('ts', now))
+                    # Append each numeric field to its compressed column
+                    for name, path in SERIES_FIELDS.get(metric_type, {}).items():
+                        value = metrics
+                        for part in path:
+                            value = value.get(part) if isinstance(value, dict) else None
+                        if not isinstance(value, (int, float)):
+                            continue
+                        
+                        key = f"ts:{metric_type}:{name}"
+                        series = self._series.setdefault(key, CompressedSeries())
+                        chunk = series.append(ts, float(value))
+                        if series.should_compact:
+                            pipe.set(key, series.encode_all())
+                        else:
+                            pipe.append(key, chunk)
+                        pipe.expire(key, 86400)  # Drop columns that stop updating
+                    
+                    # Full snapshots go to a self-trimming stream; the newest entry is the latest
+                    pipe.xadd(
+                        f"metrics:{metric_type}",
+                        {"json": orjson.dumps(metrics)},
+                        maxlen=STREAM_MAXLEN,
+                        approximate=True,
+                    )
+                await pipe.execute()
             
         except Exception as e:
             logger.error(f"Error storing metrics: {e}")
     
+    async def get_metric_history(self, metric_type: str, count: int = 24) -> List[Dict[str, Any]]:
+        """Most recent full snapshots of a metric type, newest first"""
+        entries = await self.redis_client.xrevrange(f"metrics:{metric_type}", count=count)
+        return [orjson.loads(fields[b"json"]) for _, fields in entries]
+    
+    async def get_latest_metrics(self, metric_type: str) -> Dict[str, Any]:
+        history = await self.get_metric_history(metric_type, count=1)
+        return history[0] if history else {}
+    
+    async def collect_all_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Collect every metric type, then persist them together"""
+        batch = {
+            'system': await self.collect_system_metrics(store=False),
+            'application': await self.collect_application_metrics(store=False),
+            'database': await self.collect_database_metrics(store=False),
+            'redis': await self.collect_redis_metrics(store=False),
+        }
+        await self.store_metrics_batch(batch)
+        return batch
+    
     async def get_active_users(self) -> int:
         """Get number of active users"""
         try:
@@ -228,15 +474,14 @@ class PerformanceMonitor:
     async def get_cache_hit_rate(self) -> float:
         """Get cache hit rate"""
         try:
-            info = self.redis_client.info()
-            return self.calculate_hit_rate(info)
+            return self.calculate_hit_rate(await self.get_redis_info())
         except Exception:
             return 0.0
     
     async def get_queue_length(self) -> int:
         """Get Celery queue length"""
         try:
-            return self.redis_client.llen('celery')
+            return await self.redis_client.llen('cpu') + await self.redis_client.llen('io')
         except Exception:
             return 0
     
@@ -258,77 +503,58 @@ class PerformanceMonitor:
     async def analyze_metric_trends(self, metric_type: str) -> Dict[str, Any]:
         """Analyze trends for a specific metric type"""
         try:
-            # Get historical metrics from Redis
-            pattern = f"metrics:{metric_type}:*"
-            keys = self.redis_client.keys(pattern)
-            
-            if not keys:
+            names = list(SERIES_FIELDS.get(metric_type, {}))
+            if not names:
                 return {}
             
-            # Sort keys by timestamp
-            keys.sort()
+            blobs = await self.redis_client.mget([f"ts:{metric_type}:{name}" for name in names])
             
-            # Get last 24 hours of data
-            cutoff_time = datetime.utcnow() - timedelta(hours=24)
-            recent_keys = [k for k in keys if self.parse_key_timestamp(k) > cutoff_time]
+            # Last 24 data points of the last 24 hours
+            cutoff = time.time() - 86400
+            series = {}
+            for name, blob in zip(names, blobs):
+                if not blob:
+                    continue
+                timestamps, values = CompressedSeries.decode(blob)
+                recent = timestamps > cutoff
+                if recent.any():
+                    series[name] = (timestamps[recent][-24:], values[recent][-24:])
             
-            if not recent_keys:
-                return {}
-            
-            # Analyze trends
-            metrics_data = []
-            for key in recent_keys[-24:]:  # Last 24 data points
-                data = self.redis_client.get(key)
-                if data:
-                    metrics_data.append(json.loads(data))
-            
-            return self.calculate_trends(metrics_data)
+            return self.calculate_trends(series)
             
         except Exception as e:
             logger.error(f"Error analyzing {metric_type} trends: {e}")
             return {}
     
-    def parse_key_timestamp(self, key: str) -> datetime:
-        """Parse timestamp from Redis key"""
-        try:
-            timestamp_str = key.decode().split(':')[-1]
-            return datetime.strptime(timestamp_str, '%Y%m%d%H%M')
-        except Exception:
-            return datetime.min
-    
-    def calculate_trends(self, metrics_data: List[Dict]) -> Dict[str, Any]:
-        """Calculate trends from metrics data"""
-        if not metrics_data:
+    def calculate_trends(self, series: Dict[str, Tuple[np.ndarray, np.ndarray]]) -> Dict[str, Any]:
+        """Calculate trends from decoded metric columns"""
+        if not series:
             return {}
         
+        timestamps = next(iter(series.values()))[0]
+        
         # Simple trend analysis - can be enhanced with more sophisticated algorithms
         trends = {
-            'data_points': len(metrics_data),
+            'data_points': len(timestamps),
             'time_range': {
-                'start': metrics_data[0].get('timestamp'),
-                'end': metrics_data[-1].get('timestamp')
+                'start': float(timestamps[0]),
+                'end': float(timestamps[-1])
             }
         }
         
-        # Analyze CPU trend if available
-        if 'cpu' in metrics_data[0]:
-            cpu_values = [m['cpu']['usage_percent'] for m in metrics_data if 'cpu' in m]
-            if cpu_values:
-                trends['cpu'] = {
-                    'current': cpu_values[-1],
-                    'average': sum(cpu_values) / len(cpu_values),
-                    'trend': 'increasing' if cpu_values[-1] > cpu_values[0] else 'decreasing'
-                }
-        
-        # Analyze memory trend if available
-        if 'memory' in metrics_data[0]:
-            memory_values = [m['memory']['usage_percent'] for m in metrics_data if 'memory' in m]
-            if memory_values:
-                trends['memory'] = {
-                    'current': memory_values[-1],
-                    'average': sum(memory_values) / len(memory_values),
-                    'trend': 'increasing' if memory_values[-1] > memory_values[0] else 'decreasing'
-                }
+        for name, (_, values) in series.items():
+            # Least-squares slope per sample; steadier than comparing endpoints
+            slope = float(np.polyfit(np.arange(values.size), values, 1)[0]) if values.size > 1 else 0.0
+            if abs(slope) < 1e-9:  # Flat column; ignore float round-off
+                slope = 0.0
+            trends[name] = {
+                'current': float(values[-1]),
+                'average': float(values.mean()),
+                'min': float(values.min()),
+                'max': float(values.max()),
+                'slope': slope,
+                'trend': 'increasing' if slope > 0 else 'decreasing'
+            }
         
         return trends
     
@@ -336,10 +562,11 @@ class PerformanceMonitor:
         """Generate comprehensive performance report"""
         try:
             # Collect current metrics
-            system_metrics = await self.collect_system_metrics()
-            app_metrics = await self.collect_application_metrics()
-            db_metrics = await self.collect_database_metrics()
-            redis_metrics = await self.collect_redis_metrics()
+            current = await self.collect_all_metrics()
+            system_metrics = current['system']
+            app_metrics = current['application']
+            db_metrics = current['database']
+            redis_metrics = current['redis']
             
             # Analyze trends
             trends = await self.analyze_performance_trends()
@@ -349,15 +576,22 @@ class PerformanceMonitor:
                 system_metrics, app_metrics, db_metrics, redis_metrics, trends
             )
             
+            # Epoch floats become ISO strings only here, for readers of the report
             report = {
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': self.format_ts(time.time()),
                 'current_metrics': {
-                    'system': system_metrics,
-                    'application': app_metrics,
-                    'database': db_metrics,
-                    'redis': redis_metrics
+                    name: {**metrics, 'ts': self.format_ts(metrics['ts'])} if 'ts' in metrics else metrics
+                    for name, metrics in current.items()
+                },
+                'trends': {
+                    name: {
+                        **trend,
+                        'time_range': {
+                            edge: self.format_ts(ts) for edge, ts in trend['time_range'].items()
+                        }
+                    } if 'time_range' in trend else trend
+                    for name, trend in trends.items()
                 },
-                'trends': trends,
                 'recommendations': recommendations,
                 'health_score': self.calculate_health_score(
                     system_metrics, app_metrics, db_metrics, redis_metrics
@@ -370,73 +604,27 @@ class PerformanceMonitor:
             logger.error(f"Error generating performance report: {e}")
             return {}
     
+    @staticmethod
+    def format_ts(ts: float) -> str:
+        return datetime.utcfromtimestamp(ts).isoformat()
+    
     def generate_recommendations(self, *metrics) -> List[str]:
         """Generate performance recommendations"""
-        recommendations = []
-        
-        # System recommendations
-        if metrics and len(metrics) > 0 and metrics[0]:
-            system = metrics[0]
-            if system.get('cpu', {}).get('usage_percent', 0) > 80:
-                recommendations.append("High CPU usage detected. Consider scaling up or optimizing CPU-intensive tasks.")
-            
-            if system.get('memory', {}).get('usage_percent', 0) > 85:
-                recommendations.append("High memory usage detected. Consider adding more memory or optimizing memory usage.")
-            
-            if system.get('disk', {}).get('usage_percent', 0) > 90:
-                recommendations.append("Low disk space. Consider cleaning up old files or expanding storage.")
-        
-        # Application recommendations
-        if len(metrics) > 1 and metrics[1]:
-            app = metrics[1]
-            if app.get('error_rate', 0) > 0.05:
-                recommendations.append("High error rate detected. Review error logs and fix underlying issues.")
-            
-            if app.get('api_response_time', 0) > 1.0:
-                recommendations.append("Slow API response times. Consider optimizing database queries or adding caching.")
-        
-        # Database recommendations
-        if len(metrics) > 2 and metrics[2]:
-            db = metrics[2]
-            if db.get('active_connections', 0) > 80:
-                recommendations.append("High database connection count. Consider connection pooling optimization.")
-            
-            if db.get('slow_queries', 0) > 5:
-                recommendations.append("Slow queries detected. Review and optimize database queries.")
-        
-        # Redis recommendations
-        if len(metrics) > 3 and metrics[3]:
-            redis = metrics[3]
-            if redis.get('hit_rate', 0) < 80:
-                recommendations.append("Low Redis hit rate. Review caching strategy and cache keys.")
-        
-        return recommendations
+        return [
+            message
+            for idx, path, op, threshold, message in RECOMMENDATION_RULES
+            if (value := _metric_value(metrics, idx, path)) is not None and op(value, threshold)
+        ]
     
     def calculate_health_score(self, *metrics) -> float:
         """Calculate overall health score (0-100)"""
         score = 100.0
         
-        # Deduct points for high resource usage
-        if metrics and len(metrics) > 0 and metrics[0]:
-            system = metrics[0]
-            cpu_usage = system.get('cpu', {}).get('usage_percent', 0)
-            memory_usage = system.get('memory', {}).get('usage_percent', 0)
-            
-            if cpu_usage > 80:
-                score -= (cpu_usage - 80) * 0.5
-            if memory_usage > 85:
-                score -= (memory_usage - 85) * 0.5
-        
-        # Deduct points for application issues
-        if len(metrics) > 1 and metrics[1]:
-            app = metrics[1]
-            error_rate = app.get('error_rate', 0)
-            response_time = app.get('api_response_time', 0)
-            
-            if error_rate > 0.05:
-                score -= error_rate * 100
-            if response_time > 1.0:
-                score -= (response_time - 1.0) * 10
+        # Deduct points for high resource usage and application issues
+        for idx, path, threshold, base, weight in HEALTH_RULES:
+            value = _metric_value(metrics, idx, path)
+            if value is not None and value > threshold:
+                score -= (value - base) * weight
         
         # Ensure score doesn't go below 0
         return max(0, score)
@@ -447,14 +635,12 @@ performance_monitor = PerformanceMonitor()
 async def main():
     """Main monitoring loop"""
     logger.info("Starting performance monitoring...")
+    performance_monitor.start_metrics_server()
     
     while True:
         try:
             # Collect all metrics
-            await performance_monitor.collect_system_metrics()
-            await performance_monitor.collect_application_metrics()
-            await performance_monitor.collect_database_metrics()
-            await performance_monitor.collect_redis_metrics()
+            await performance_monitor.collect_all_metrics()
             
             # Generate report every hour
             if datetime.utcnow().minute == 0:
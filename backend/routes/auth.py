@@ -1,45 +1,102 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.dialects.postgresql import insert
+from redis.exceptions import RedisError
+from slowapi.util import get_remote_address
 
 from database import get_db
 from models import User
 from schemas import UserCreate, UserLogin, UserRead, Token
-from utils import create_access_token, hash_password, verify_password
+from auth_utils import DUMMY_HASH, create_access_token, hash_password, verify_and_update_password, verify_password
+from utils.security import check_rate_limit, redis_client
+
 
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# Built once so every login reuses the same cache key and asyncpg prepared statement
+_user_by_email_stmt = select(User).where(User.email == bindparam("email"))
+
+# Registration attempts per client IP per window
+_REGISTER_MAX_CALLS = 5
+_REGISTER_WINDOW_SECONDS = 60
+
+# Seconds a taken email short-circuits register without hashing or a DB hit
+_EMAIL_EXISTS_TTL = 10
+
+
+async def _email_known_taken(exists_key: str) -> bool:
+    # The short-circuit is an optimisation; without Redis the insert still decides
+    try:
+        return await redis_client.get(exists_key) == "1"
+    except RedisError as e:
+        logger.warning(f"Email-exists cache read failed: {e}")
+        return False
+
+
+async def _mark_email_taken(exists_key: str) -> None:
+    try:
+        await redis_client.set(exists_key, "1", ex=_EMAIL_EXISTS_TTL)
+    except RedisError as e:
+        logger.warning(f"Email-exists cache write failed: {e}")
+
 
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-async def register(user_in: UserCreate, db: AsyncSession = Depends(get_db)) -> UserRead:
-    stmt = select(User).where(User.email == user_in.email)
-    result = await db.execute(stmt)
-    existing = result.scalar_one_or_none()
-    if existing:
+async def register(
+    user_in: UserCreate, request: Request, db: AsyncSession = Depends(get_db)
+) -> UserRead:
+    await check_rate_limit(
+        "register", get_remote_address(request), _REGISTER_MAX_CALLS, _REGISTER_WINDOW_SECONDS
+    )
+
+    exists_key = f"em:{user_in.email}"
+    if await _email_known_taken(exists_key):
         raise HTTPException(status_code=400, detail="Email already registered")
 
-    user = User(
-        name=user_in.name,
-        email=user_in.email,
-        password_hash=hash_password(user_in.password),
+    # Existence check and insert in one statement; the unique email index decides races
+    stmt = (
+        insert(User)
+        .values(
+            name=user_in.name,
+            email=user_in.email,
+            password_hash=hash_password(user_in.password),
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User)
     )
-    db.add(user)
+    result = await db.execute(stmt)
+    user = result.scalar_one_or_none()
+    if user is None:
+        await _mark_email_taken(exists_key)
+        raise HTTPException(status_code=400, detail="Email already registered")
     await db.commit()
-    await db.refresh(user)
+    await _mark_email_taken(exists_key)
     return user
 
 
 @router.post("/login", response_model=Token)
 async def login(user_in: UserLogin, db: AsyncSession = Depends(get_db)) -> Token:
-    stmt = select(User).where(User.email == user_in.email)
-    result = await db.execute(stmt)
+    result = await db.execute(_user_by_email_stmt, {"email": user_in.email})
     user = result.scalar_one_or_none()
-    if not user or not verify_password(user_in.password, user.password_hash):
+    if user is None:
+        # Equalize latency with the wrong-password path
+        verify_password(user_in.password, DUMMY_HASH)
+        verified, new_hash = False, None
+    else:
+        verified, new_hash = verify_and_update_password(user_in.password, user.password_hash)
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
         )
+    if new_hash:
+        # Legacy bcrypt (or under-cost) hash: store the Argon2id replacement
+        await db.execute(update(User).where(User.id == user.id).values(password_hash=new_hash))
+        await db.commit()
     token = create_access_token(subject=user.email)
     return Token(access_token=token)
 
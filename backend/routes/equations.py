@@ -1,14 +1,15 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select, delete
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import delete, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_db
 from models import Equation, User
-from schemas import EquationCreate, EquationRead
-from utils import get_current_user
+from schemas import EquationCreate, EquationListItem, EquationRead
+from auth_utils import get_current_user
 
 
 router = APIRouter(prefix="/equations", tags=["equations"])
@@ -34,15 +35,31 @@ async def save_equation(
     return equation
 
 
-@router.get("/history", response_model=List[EquationRead])
+@router.get("/history", response_model=List[EquationListItem])
 async def get_history(
+    before: Optional[datetime] = None,
+    before_id: Optional[UUID] = None,
+    limit: int = Query(50, ge=1, le=200),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> List[EquationRead]:
-    stmt = select(Equation).where(Equation.user_id == current_user.id).order_by(Equation.created_at.desc())
+) -> List[EquationListItem]:
+    """Newest first. Pass the last item's created_at and id as before/before_id for the next page."""
+    # Keyset pagination over ix_equations_user_created; list view skips steps/graph_data
+    stmt = select(
+        Equation.id,
+        Equation.expression,
+        Equation.solution,
+        Equation.confidence,
+        Equation.created_at,
+    ).where(Equation.user_id == current_user.id)
+    if before is not None and before_id is not None:
+        # Row comparison so equations sharing the boundary timestamp aren't skipped
+        stmt = stmt.where(tuple_(Equation.created_at, Equation.id) < tuple_(before, before_id))
+    elif before is not None:
+        stmt = stmt.where(Equation.created_at < before)
+    stmt = stmt.order_by(Equation.created_at.desc(), Equation.id.desc()).limit(limit)
     result = await db.execute(stmt)
-    equations = result.scalars().all()
-    return equations
+    return [EquationListItem(**row._mapping) for row in result]
 
 
 @router.delete("/{equation_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -51,9 +68,13 @@ async def delete_equation(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> None:
-    stmt = delete(Equation).where(Equation.id == equation_id, Equation.user_id == current_user.id)
-    result = await db.execute(stmt)
-    if result.rowcount == 0:
+    stmt = (
+        delete(Equation)
+        .where(Equation.id == equation_id, Equation.user_id == current_user.id)
+        .returning(Equation.id)
+    )
+    deleted = (await db.execute(stmt)).first()
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Equation not found")
     await db.commit()
 
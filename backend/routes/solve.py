@@ -1,35 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import re
+
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_db
 from schemas import SolveRequest, SolveResponse
 from services.ocr import ocr_service
 from services.solver import solver_service
-from utils import get_current_user
+from auth_utils import get_current_user
+from utils.security import check_rate_limit
 from models import User
 
 
 router = APIRouter(prefix="/solve", tags=["solve"])
 
 
-_RATE_LIMIT_BUCKET: dict[str, list[float]] = {}
-_MAX_CALLS = 30
-_WINDOW_SECONDS = 60.0
-
-
-def _rate_limit(user_identifier: str, now: float) -> None:
-    import time
+# Same blocklist as before, matched in a single pass
+_BAD_RE = re.compile(r"__|import|exec|lambda")
 
-    window_start = now - _WINDOW_SECONDS
-    bucket = _RATE_LIMIT_BUCKET.setdefault(user_identifier, [])
-    # purge old
-    bucket[:] = [t for t in bucket if t >= window_start]
-    if len(bucket) >= _MAX_CALLS:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Rate limit exceeded. Please slow down.",
-        )
-    bucket.append(now)
+_MAX_CALLS = 30
+_WINDOW_SECONDS = 60
 
 
 @router.post("/", response_model=SolveResponse)
@@ -38,36 +29,41 @@ async def solve_equation(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> SolveResponse:
-    import time
-
     _ = db  # currently unused but kept for future persistence hooks
 
-    _rate_limit(str(current_user.id), time.time())
+    await check_rate_limit("solve", str(current_user.id), _MAX_CALLS, _WINDOW_SECONDS)
 
-    if not payload.image_base64:
-        raise HTTPException(status_code=400, detail="Image is required")
-
-    # OCR
-    latex, confidence = await ocr_service.extract_math_from_image(payload.image_base64)
-    if not latex:
-        raise HTTPException(status_code=422, detail="Unable to read equation")
+    if payload.expression and payload.expression.strip():
+        # Typed input needs no OCR, so there is no recognition confidence to report
+        latex, confidence, source = payload.expression.strip(), None, "typed"
+    elif payload.image_base64:
+        # OCR
+        latex, confidence = await ocr_service.extract_math_from_image(payload.image_base64)
+        source = "ocr"
+        if not latex:
+            raise HTTPException(status_code=422, detail="Unable to read equation")
+    else:
+        raise HTTPException(status_code=400, detail="Image or expression is required")
 
     # Basic validation / sanitization: SymPy will reject unsafe content; we
     # also forbid certain characters.
-    if any(bad in latex for bad in ["__", "import", "exec", "lambda"]):
+    if _BAD_RE.search(latex):
         raise HTTPException(status_code=400, detail="Invalid expression content")
 
     # Solve generically; in a more advanced setup you'd branch by detected type.
-    try:
-        solution_latex, steps = solver_service.solve_generic(latex)
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=422, detail=f"Could not solve expression: {exc}")
+    # Graph data only needs the expression, so build it alongside the solve,
+    # both off the event loop.
+    solved, graph_data = await asyncio.gather(
+        asyncio.to_thread(solver_service.solve_generic, latex),
+        asyncio.to_thread(solver_service.build_graph_data, latex),
+        return_exceptions=True,
+    )
+    if isinstance(solved, Exception):
+        raise HTTPException(status_code=422, detail=f"Could not solve expression: {solved}")
+    solution_latex, steps = solved
 
     # Graph data (best-effort)
-    graph_data = None
-    try:
-        graph_data = solver_service.build_graph_data(latex)
-    except Exception:
+    if isinstance(graph_data, Exception):
         graph_data = None
 
     # If confidence low, client can show suggestion UI
@@ -77,5 +73,6 @@ async def solve_equation(
         steps=steps,
         graph_data=graph_data,
         confidence=confidence,
+        source=source,
     )
 
@@ -1,20 +1,45 @@
 from datetime import datetime
-from typing import Any, Optional, Dict
+from functools import lru_cache
+from typing import Any, Dict, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
+from email_validator import EmailNotValidError, validate_email
+from pydantic import Base64Bytes, BaseModel, ConfigDict, Field, field_validator
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_email(email: str) -> bool:
+    # Syntax only; no DNS deliverability lookups
+    try:
+        validate_email(email, check_deliverability=False)
+    except EmailNotValidError:
+        return False
+    return True
+
+
+def _normalize_email(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    email = value.strip().lower()
+    if not _is_valid_email(email):
+        raise ValueError("value is not a valid email address")
+    return email
 
 
 class UserCreate(BaseModel):
     name: str
-    email: EmailStr
+    email: str = Field(json_schema_extra={"format": "email"})
     password: str = Field(min_length=8)
 
+    _normalize_email = field_validator("email", mode="before")(_normalize_email)
+
 
 class UserLogin(BaseModel):
-    email: EmailStr
+    email: str = Field(json_schema_extra={"format": "email"})
     password: str
 
+    _normalize_email = field_validator("email", mode="before")(_normalize_email)
+
 
 class UserRead(BaseModel):
     id: UUID
@@ -22,8 +47,7 @@ class UserRead(BaseModel):
     email: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Token(BaseModel):
@@ -49,12 +73,43 @@ class EquationRead(BaseModel):
     confidence: Optional[float]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class EquationListItem(BaseModel):
+    id: UUID
+    expression: str
+    solution: Optional[str]
+    confidence: Optional[float]
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SolveRequest(BaseModel):
-    image_base64: str
+    """Either a handwritten image to OCR, or an already-typed expression that skips OCR."""
+
+    model_config = ConfigDict(
+        str_max_length=20_000_000,
+        json_schema_extra={
+            "examples": [
+                {"image_base64": "data:image/png;base64,iVBORw0KGgo..."},
+                {"expression": "x**2 - 4 = 0"},
+            ]
+        },
+    )
+
+    # Decoded once by pydantic-core; capped at the decoded size of the str limit
+    image_base64: Optional[Base64Bytes] = Field(default=None, max_length=15_000_000)
+    expression: Optional[str] = Field(default=None, max_length=2_000)
+
+    @field_validator("image_base64", mode="before")
+    @classmethod
+    def strip_data_url(cls, value: Any) -> Any:
+        # Canvas exports arrive as "data:image/png;base64,..."
+        if isinstance(value, str) and value.startswith("data:"):
+            return value.partition(",")[2]
+        return value
 
 
 class SolveResponse(BaseModel):
@@ -62,7 +117,9 @@ class SolveResponse(BaseModel):
     solution: str
     steps: str
     graph_data: Optional[Dict[str, Any]]
-    confidence: float
+    # OCR confidence; None for typed input, which was never recognized
+    confidence: Optional[float]
+    source: Literal["ocr", "typed"]
 
 
 class HealthResponse(BaseModel):
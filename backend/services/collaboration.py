@@ -1,18 +1,56 @@
 import socketio
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Cursor updates are coalesced and flushed at most once per tick
+CURSOR_FLUSH_INTERVAL = 0.033
+
 # Initialize Socket.io Async Server
 sio = socketio.AsyncServer(async_mode='asgi', cors_allowed_origins='*')
 socket_app = socketio.ASGIApp(sio)
 
+# room_id -> sid -> most recent cursor payload since the last flush
+_latest_cursor: dict[str, dict[str, dict]] = {}
+_flush_task = None
+
+async def _flush_cursors():
+    global _flush_task
+    try:
+        while True:
+            await asyncio.sleep(CURSOR_FLUSH_INTERVAL)
+            if not _latest_cursor:
+                # Idle; the next sync_cursor starts a new flusher
+                break
+            pending = list(_latest_cursor.items())
+            _latest_cursor.clear()
+            for room_id, cursors in pending:
+                for sid, data in cursors.items():
+                    try:
+                        await sio.emit('cursor_updated', data, room=room_id, skip_sid=sid)
+                    except Exception as e:
+                        logger.error(f"Failed to emit cursor for {sid} in room {room_id}: {e}")
+    finally:
+        # Let the next cursor event start a fresh flusher
+        _flush_task = None
+
+def _drop_cursor(sid, room_id=None):
+    rooms = [room_id] if room_id else list(_latest_cursor)
+    for room in rooms:
+        cursors = _latest_cursor.get(room)
+        if cursors is not None:
+            cursors.pop(sid, None)
+            if not cursors:
+                _latest_cursor.pop(room, None)
+
 @sio.event
 async def connect(sid, environ):
     logger.info(f"Client connected: {sid}")
 
 @sio.event
 async def disconnect(sid):
+    _drop_cursor(sid)
     logger.info(f"Client disconnected: {sid}")
 
 @sio.event
@@ -29,14 +67,18 @@ async def leave_room(sid, data):
     room_id = data.get('roomId')
     if room_id:
         sio.leave_room(sid, room_id)
+        _drop_cursor(sid, room_id)
         logger.info(f"Client {sid} left room {room_id}")
 
 @sio.event
 async def sync_cursor(sid, data):
     # data: { roomId, userId, landmarks }
+    global _flush_task
     room_id = data.get('roomId')
     if room_id:
-        await sio.emit('cursor_updated', data, room=room_id, skip_sid=sid)
+        _latest_cursor.setdefault(room_id, {})[sid] = data
+        if _flush_task is None:
+            _flush_task = sio.start_background_task(_flush_cursors)
 
 @sio.event
 async def object_update(sid, data):
@@ -1,99 +1,267 @@
+import asyncio
 import base64
+import concurrent.futures
+import hashlib
 import io
+import json
+import logging
+import os
 import re
-from typing import Tuple, Optional
+import tempfile
+from typing import List, Tuple, Optional
 
 import pytesseract
 from PIL import Image
 import numpy as np
 
+from utils.security import get_cache, set_cache
+
+logger = logging.getLogger(__name__)
+
+
+# Single-character OCR fixes, applied in one str.translate pass
+_SINGLE_CHAR_FIXES = str.maketrans({
+    'x': '*',
+    '×': '*',
+    '÷': '/',
+    '−': '-',
+    '–': '-',
+    '[': '(',
+    ']': ')',
+    '{': '(',
+    '}': ')',
+})
+
+# Multi-character tokens, replaced in one regex pass
+_TOKEN_FIXES = {
+    'partial': '∂',
+    'arcsin': 'asin',
+    'arccos': 'acos',
+    'arctan': 'atan',
+    'log10': 'log',
+    'delta': '∆',
+    'nabla': '∇',
+    'sqrt': '√',
+    'int': '∫',
+    'sum': '∑',
+    'pi': 'π',
+    'ln': 'log',
+}
+# Longest alternative first, so a token that is a prefix of another can never shadow it
+_TOKEN_RE = re.compile('|'.join(map(re.escape, sorted(_TOKEN_FIXES, key=len, reverse=True))))
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_NON_MATH_RE = re.compile(r'[^0-9+\-*/=()\[\]{}^√π∫∑∂∆∇a-zA-Z.,]')
+_MATH_CHARS_RE = re.compile(r'[0-9+\-*/=()\[\]{}^√π∫∑∂∆∇]')
+
+
+# Concurrent requests arriving within this window share one tesseract run
+OCR_BATCH_WINDOW = float(os.getenv("OCR_BATCH_WINDOW", "0.01"))
+OCR_BATCH_MAX = int(os.getenv("OCR_BATCH_MAX", "16"))
+
+# Seconds an OCR result stays cached per image hash
+OCR_CACHE_TTL = 86400
+
+# Each tesseract process gets a few OpenMP threads; the pool bounds how many run at once
+os.environ.setdefault("OMP_THREAD_LIMIT", "4")
+_OCR_WORKERS = max(1, (os.cpu_count() or 1) // 4)
+_OCR_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=_OCR_WORKERS, thread_name_prefix='ocr')
+
+# Tesseract ends every page of a multi-image run with a form feed
+_PAGE_SEPARATOR = '\x0c'
+
 
 class OCRService:
     def __init__(self):
         # Configure Tesseract for math recognition
         self.tesseract_config = r'--oem 3 --psm 6 -c tessedit_char_whitelist=0123456789+-×÷=()[]{}^√π∫∑∂∆∇abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ.,'
+        # Created on first use, inside the running event loop
+        self._pending: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._dispatching: set = set()
+        self._in_flight: dict = {}
     
-    async def extract_math_from_image(self, image_base64: str) -> Tuple[str, float]:
+    async def extract_math_from_image(self, image_data: bytes) -> Tuple[str, float]:
         """
-        Extract mathematical expression from base64 image using Tesseract OCR
+        Extract mathematical expression from raw image bytes using Tesseract OCR
         """
+        key = 'ocr:' + hashlib.blake2b(image_data, digest_size=16).hexdigest()
         try:
-            # Decode base64 image
-            image_data = base64.b64decode(image_base64.split(',')[1] if ',' in image_base64 else image_base64)
-            image = Image.open(io.BytesIO(image_data))
-            
-            # Convert to grayscale and enhance contrast
-            image = image.convert('L')
-            image = self._enhance_image(image)
-            
-            # Extract text using Tesseract
-            text = pytesseract.image_to_string(image, config=self.tesseract_config)
-            
-            # Clean and normalize the extracted text
-            cleaned_text = self._clean_math_text(text)
+            cached = await get_cache(key)
+        except Exception as e:
+            logger.warning(f"OCR cache error: {e}")
+            cached = None
+        if cached:
+            text, confidence = json.loads(cached)
+            return text, confidence
+        
+        # Identical images already being read share that result. The read runs in its
+        # own task so a cancelled caller never cancels it for the others
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._extract_and_cache(key, image_data))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._finish_in_flight(key, t))
+        return await asyncio.shield(task)
+    
+    async def _extract_and_cache(self, key: str, image_data: bytes) -> Tuple[str, float]:
+        result = await self._extract(image_data)
+        if result[0]:
+            try:
+                await set_cache(key, json.dumps(result), expire=OCR_CACHE_TTL)
+            except Exception as e:
+                logger.warning(f"OCR cache error: {e}")
+        return result
+    
+    def _finish_in_flight(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Retrieve the error so it isn't reported as unhandled when every caller has gone
+        if not task.cancelled():
+            task.exception()
+    
+    async def _extract(self, image_data: bytes) -> Tuple[str, float]:
+        try:
+            # Decode, downscale and threshold on the OCR pool, not the event loop
+            loop = asyncio.get_running_loop()
+            image = await loop.run_in_executor(_OCR_POOL, self._prepare_image, image_data)
             
-            # Calculate confidence (simplified)
-            confidence = self._calculate_confidence(text, cleaned_text)
+            # Extract text using Tesseract, batched with concurrent requests
+            if self._pending is None:
+                self._pending = asyncio.Queue()
+            if self._batcher is None or self._batcher.done():
+                self._batcher = asyncio.create_task(self._run_batches())
+            future = loop.create_future()
+            await self._pending.put((image, future))
+            text = await future
             
-            return cleaned_text, confidence
+            return self._score(text)
             
         except Exception as e:
-            print(f"OCR Error: {e}")
+            logger.exception(f"OCR Error: {e}")
             return "", 0.0
     
+    async def extract_math_batch(self, images: List[bytes]) -> List[Tuple[str, float]]:
+        """
+        Extract expressions from several images with a single tesseract invocation
+        """
+        try:
+            texts = await asyncio.get_running_loop().run_in_executor(_OCR_POOL, self._read_batch, images)
+            return [self._score(text) for text in texts]
+        except Exception as e:
+            logger.exception(f"OCR Error: {e}")
+            return [("", 0.0)] * len(images)
+    
+    def _read_batch(self, images: List[bytes]) -> List[str]:
+        """Prepare and OCR a batch in one pool job, keeping PIL work off the event loop"""
+        return self._tesseract_batch([self._prepare_image(image_data) for image_data in images])
+    
+    def _prepare_image(self, image_data: bytes) -> Image.Image:
+        image = Image.open(io.BytesIO(image_data))
+        
+        # JPEGs can be decoded straight to grayscale; a no-op for other formats
+        image.draft('L', image.size)
+        image.load()
+        
+        # Convert to grayscale and enhance contrast
+        if image.mode != 'L':
+            image = image.convert('L')
+        return self._enhance_image(image)
+    
+    def _score(self, text: str) -> Tuple[str, float]:
+        # Clean and normalize the extracted text
+        cleaned_text = self._clean_math_text(text)
+        
+        # Calculate confidence (simplified)
+        confidence = self._calculate_confidence(text, cleaned_text)
+        
+        return cleaned_text, confidence
+    
+    async def _run_batches(self):
+        """Drain the queue into batches of up to OCR_BATCH_MAX images, one per free OCR worker"""
+        loop = asyncio.get_running_loop()
+        workers = asyncio.Semaphore(_OCR_WORKERS)
+        while True:
+            # Wait for a free worker first so a backlog coalesces into larger batches
+            await workers.acquire()
+            batch = [await self._pending.get()]
+            deadline = loop.time() + OCR_BATCH_WINDOW
+            while len(batch) < OCR_BATCH_MAX:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._pending.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            task = asyncio.create_task(self._dispatch(batch, workers))
+            self._dispatching.add(task)
+            task.add_done_callback(self._dispatching.discard)
+    
+    async def _dispatch(self, batch, workers: asyncio.Semaphore):
+        images = [image for image, _ in batch]
+        try:
+            texts = await asyncio.get_running_loop().run_in_executor(_OCR_POOL, self._tesseract_batch, images)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            workers.release()
+        for (_, future), text in zip(batch, texts):
+            if not future.done():
+                future.set_result(text)
+    
+    def _tesseract_batch(self, images: List[Image.Image]) -> List[str]:
+        """One tesseract process for all images: it accepts a text file listing image paths"""
+        if len(images) == 1:
+            return [pytesseract.image_to_string(images[0], config=self.tesseract_config)]
+        
+        with tempfile.TemporaryDirectory(prefix='ocr-') as tmp:
+            paths = []
+            for i, image in enumerate(images):
+                path = os.path.join(tmp, f'{i}.png')
+                image.save(path)
+                paths.append(path)
+            list_path = os.path.join(tmp, 'images.txt')
+            with open(list_path, 'w') as f:
+                f.write('\n'.join(paths) + '\n')
+            
+            output = pytesseract.image_to_string(list_path, config=self.tesseract_config)
+        
+        pages = output.split(_PAGE_SEPARATOR)
+        if len(pages) < len(images):
+            # Page boundaries lost; fall back to one run per image
+            return [pytesseract.image_to_string(image, config=self.tesseract_config) for image in images]
+        return pages[:len(images)]
+    
     def _enhance_image(self, image: Image.Image) -> Image.Image:
         """Enhance image for better OCR results"""
-        # Convert to numpy array
-        img_array = np.array(image)
+        # Read-only view of the decoded 'L' pixels; the threshold below is the only allocation
+        img_array = np.asarray(image)
         
-        # Apply threshold to make text more clear
+        # Apply threshold to make text more clear: the bool mask reinterpreted as
+        # uint8 0/1, scaled in place (one uint8 buffer, no int64 temporary)
         threshold = 128
-        img_array = np.where(img_array > threshold, 255, 0).astype(np.uint8)
+        binary = (img_array > threshold).view(np.uint8)
+        binary *= 255
         
-        # Convert back to PIL Image
-        return Image.fromarray(img_array)
+        # Wrap the buffer as a PIL Image without copying
+        return Image.frombuffer('L', image.size, binary, 'raw', 'L', 0, 1)
     
     def _clean_math_text(self, text: str) -> str:
         """Clean and normalize extracted math text"""
         # Remove extra whitespace
-        text = re.sub(r'\s+', '', text)
+        text = _WHITESPACE_RE.sub('', text)
         
         # Replace common OCR mistakes
-        replacements = {
-            'x': '*',
-            '×': '*',
-            '÷': '/',
-            '−': '-',
-            '–': '-',
-            '=': '=',
-            '(': '(',
-            ')': ')',
-            '[': '(',
-            ']': ')',
-            '{': '(',
-            '}': ')',
-            'sqrt': '√',
-            'pi': 'π',
-            'int': '∫',
-            'sum': '∑',
-            'partial': '∂',
-            'delta': '∆',
-            'nabla': '∇',
-            'ln': 'log',
-            'log10': 'log',
-            'sin': 'sin',
-            'cos': 'cos',
-            'tan': 'tan',
-            'arcsin': 'asin',
-            'arccos': 'acos',
-            'arctan': 'atan',
-        }
-        
-        for old, new in replacements.items():
-            text = text.replace(old, new)
+        text = text.translate(_SINGLE_CHAR_FIXES)
+        text = _TOKEN_RE.sub(lambda m: _TOKEN_FIXES[m.group()], text)
         
         # Remove any non-math characters
-        text = re.sub(r'[^0-9+\-*/=()[]{}^√π∫∑∂∆∇abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ.,]', '', text)
+        text = _NON_MATH_RE.sub('', text)
         
         return text.strip()
     
@@ -104,7 +272,7 @@ class OCRService:
         
         # Simple confidence based on length and character recognition
         length_ratio = len(cleaned_text) / max(len(original_text), 1)
-        math_chars = len(re.findall(r'[0-9+\-*/=()[]{}^√π∫∑∂∆∇]', cleaned_text))
+        math_chars = sum(1 for _ in _MATH_CHARS_RE.finditer(cleaned_text))
         math_ratio = math_chars / max(len(cleaned_text), 1)
         
         confidence = (length_ratio * 0.4 + math_ratio * 0.6) * 100
@@ -112,7 +280,8 @@ class OCRService:
 
     # Keep the old interface for compatibility
     async def call_mathpix(self, image_base64: str) -> Tuple[str, float]:
-        return await self.extract_math_from_image(image_base64)
+        image_data = base64.b64decode(image_base64.split(',')[1] if ',' in image_base64 else image_base64)
+        return await self.extract_math_from_image(image_data)
 
 
 # Singleton instance
@@ -1,75 +1,150 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Tuple
 
+import numpy as np
 import sympy as sp
+from sympy.parsing.sympy_parser import parse_expr
+
+# Sample grid shared by every graph
+_GRAPH_XS = np.linspace(-10, 10, 400)
+_GRAPH_X_LIST = _GRAPH_XS.tolist()
+
+
+# SymPy expressions are immutable, so parsed results can be shared across requests
+@lru_cache(maxsize=1024)
+def _sympify_cached(expression: str) -> sp.Expr:
+    return sp.sympify(expression)
+
+
+_X, _Y, _Z = sp.symbols("x y z")
+_SYMBOLS = {"x": _X, "y": _Y, "z": _Z}
+_parse = partial(parse_expr, local_dict=_SYMBOLS)
+
+
+def _symbol(var: str) -> sp.Symbol:
+    return _SYMBOLS.get(var) or sp.symbols(var)
+
+
+@lru_cache(maxsize=512)
+def _parse_system(expression: str) -> Tuple[Tuple[sp.Expr, ...], Tuple[sp.Symbol, ...]]:
+    """Equations of a ';'/','-separated system and their free symbols, sorted by name."""
+    eqs = []
+    for part in expression.replace(';', ',').split(','):
+        lhs, sep, rhs = part.strip().partition('=')
+        eqs.append(sp.Eq(_parse(lhs), _parse(rhs)) if sep else _parse(lhs))
+    free_symbols = set()
+    for eq in eqs:
+        free_symbols |= eq.free_symbols
+    return tuple(eqs), tuple(sorted(free_symbols, key=str))
+
+
+@lru_cache(maxsize=256)
+def _lambdify_cached(expression: str, var: str) -> Callable:
+    # An equation is plotted as lhs - rhs, whose zeros are its solutions
+    lhs, sep, rhs = expression.partition('=')
+    expr = _sympify_cached(lhs) - _sympify_cached(rhs) if sep else _sympify_cached(expression)
+    return sp.lambdify(_symbol(var), expr, "numpy")
+
+
+# Results are pure functions of their string inputs, so repeat requests skip SymPy entirely
+@lru_cache(maxsize=4096)
+def _solve_generic(expression: str) -> Tuple[str, str]:
+    try:
+        # Handle potential simultaneous equations separated by semicolon or comma
+        if ';' in expression or (',' in expression and '[' not in expression):
+            eqs, free_symbols = _parse_system(expression)
+            eqs = list(eqs)
+            # Determine variables
+            vars_to_solve = list(free_symbols) or [_X]
+            sol = sp.solve(eqs, vars_to_solve)
+            return sp.latex(sol), f"Solved system of equations for {vars_to_solve}: {eqs} -> {sol}"
+
+        # Split a single equation once; sympify cannot parse '=' itself
+        lhs, sep, rhs = expression.partition('=')
+        expr = sp.Eq(_sympify_cached(lhs), _sympify_cached(rhs)) if sep else _sympify_cached(expression)
+
+        # If the expression is an equation (contains Equality)
+        if isinstance(expr, sp.Equality):
+            # Solve for the first free symbol found, or x
+            vars = list(expr.free_symbols)
+            solve_for = vars[0] if vars else _X
+            sol = sp.solve(expr, solve_for)
+            steps = f"Solved equation for {solve_for}: {sp.pretty(expr)} -> {sol}"
+        else:
+            # Try to interpret as 'expr = 0'
+            eq = sp.Eq(expr, 0)
+            vars = list(expr.free_symbols)
+            solve_for = vars[0] if vars else _X
+            sol = sp.solve(eq, solve_for)
+            steps = f"Solved expression {sp.pretty(expr)} = 0 for {solve_for} -> {sol}"
+
+        solution_latex = sp.latex(sol)
+        return solution_latex, steps
+    except Exception as e:
+        return f"Error: {str(e)}", f"Failed to solve: {expression}"
+
+
+@lru_cache(maxsize=4096)
+def _derivative(expression: str, var: str) -> Tuple[str, str]:
+    expr = _sympify_cached(expression)
+    deriv = sp.diff(expr, _symbol(var))
+    return sp.latex(deriv), f"Computed derivative d/d{var} of {sp.pretty(expr)}"
+
+
+@lru_cache(maxsize=4096)
+def _integral(expression: str, var: str) -> Tuple[str, str]:
+    expr = _sympify_cached(expression)
+    integ = sp.integrate(expr, _symbol(var))
+    return sp.latex(integ), f"Computed ∫ {sp.pretty(expr)} d{var}"
+
+
+@lru_cache(maxsize=4096)
+def _limit(expression: str, var: str, point: Any) -> Tuple[str, str]:
+    expr = _sympify_cached(expression)
+    lim = sp.limit(expr, _symbol(var), point)
+    return sp.latex(lim), f"Computed limit of {sp.pretty(expr)} as {var} → {point}"
+
+
+@lru_cache(maxsize=4096)
+def _factor(expression: str) -> Tuple[str, str]:
+    expr = _sympify_cached(expression)
+    factored = sp.factor(expr)
+    return sp.latex(factored), f"Factored polynomial {sp.pretty(expr)}"
+
+
+@lru_cache(maxsize=4096)
+def _trig_simplify(expression: str) -> Tuple[str, str]:
+    expr = _sympify_cached(expression)
+    simp = sp.simplify(expr)
+    return sp.latex(simp), f"Simplified trigonometric expression {sp.pretty(expr)}"
 
 
 class MathSolverService:
     """Wrapper around SymPy to provide high-level solving utilities."""
 
     def __init__(self) -> None:
-        self.x, self.y, self.z = sp.symbols("x y z")
+        self.x, self.y, self.z = _X, _Y, _Z
 
     def _sympify(self, expression: str) -> sp.Expr:
-        return sp.sympify(expression)
+        return _sympify_cached(expression)
 
     def solve_generic(self, expression: str) -> Tuple[str, str]:
         """Attempt to solve a wide range of expressions.
 
         Returns a tuple of (solution_latex, steps_text).
         """
-        try:
-            # Handle potential simultaneous equations separated by semicolon or comma
-            if ';' in expression or (',' in expression and '[' not in expression):
-                parts = [p.strip() for p in expression.replace(';', ',').split(',')]
-                eqs = [self._sympify(p) if '=' not in p else sp.Eq(self._sympify(p.split('=')[0]), self._sympify(p.split('=')[1])) for p in parts]
-                # Determine variables
-                vars_to_solve = list(set().union(*(eq.free_symbols for eq in eqs)))
-                if not vars_to_solve:
-                    vars_to_solve = [self.x]
-                sol = sp.solve(eqs, vars_to_solve)
-                return sp.latex(sol), f"Solved system of equations for {vars_to_solve}: {eqs} -> {sol}"
-
-            expr = self._sympify(expression)
-
-            # If the expression is an equation (contains Equality)
-            if isinstance(expr, sp.Equality):
-                # Solve for the first free symbol found, or x
-                vars = list(expr.free_symbols)
-                solve_for = vars[0] if vars else self.x
-                sol = sp.solve(expr, solve_for)
-                steps = f"Solved equation for {solve_for}: {sp.pretty(expr)} -> {sol}"
-            else:
-                # Try to interpret as 'expr = 0'
-                eq = sp.Eq(expr, 0)
-                vars = list(expr.free_symbols)
-                solve_for = vars[0] if vars else self.x
-                sol = sp.solve(eq, solve_for)
-                steps = f"Solved expression {sp.pretty(expr)} = 0 for {solve_for} -> {sol}"
-
-            solution_latex = sp.latex(sol)
-            return solution_latex, steps
-        except Exception as e:
-            return f"Error: {str(e)}", f"Failed to solve: {expression}"
+        return _solve_generic(expression)
 
     def derivative(self, expression: str, var: str = "x") -> Tuple[str, str]:
-        sym = sp.symbols(var)
-        expr = self._sympify(expression)
-        deriv = sp.diff(expr, sym)
-        return sp.latex(deriv), f"Computed derivative d/d{var} of {sp.pretty(expr)}"
+        return _derivative(expression, var)
 
     def integral(self, expression: str, var: str = "x") -> Tuple[str, str]:
-        sym = sp.symbols(var)
-        expr = self._sympify(expression)
-        integ = sp.integrate(expr, sym)
-        return sp.latex(integ), f"Computed ∫ {sp.pretty(expr)} d{var}"
+        return _integral(expression, var)
 
     def limit(self, expression: str, var: str, point: Any) -> Tuple[str, str]:
-        sym = sp.symbols(var)
-        expr = self._sympify(expression)
-        lim = sp.limit(expr, sym, point)
-        return sp.latex(lim), f"Computed limit of {sp.pretty(expr)} as {var} → {point}"
+        return _limit(expression, var, point)
 
     def matrix_determinant(self, matrix_expr: List[List[str]]) -> Tuple[str, str]:
         mat = sp.Matrix([[self._sympify(e) for e in row] for row in matrix_expr])
@@ -82,29 +157,26 @@ class MathSolverService:
         return sp.latex(inv), f"Computed inverse of matrix {mat}"
 
     def factor_polynomial(self, expression: str) -> Tuple[str, str]:
-        expr = self._sympify(expression)
-        factored = sp.factor(expr)
-        return sp.latex(factored), f"Factored polynomial {sp.pretty(expr)}"
+        return _factor(expression)
 
     def trig_simplify(self, expression: str) -> Tuple[str, str]:
-        expr = self._sympify(expression)
-        simp = sp.simplify(expr)
-        return sp.latex(simp), f"Simplified trigonometric expression {sp.pretty(expr)}"
+        return _trig_simplify(expression)
 
     def build_graph_data(self, expression: str, var: str = "x") -> Dict[str, Any]:
-        """Generate x/y pairs for plotting y = f(x)."""
-        sym = sp.symbols(var)
-        expr = self._sympify(expression)
-        func = sp.lambdify(sym, expr, "numpy")
-
-        import numpy as np
+        """Generate x/y pairs for plotting y = f(x); an equation plots lhs - rhs."""
+        func = _lambdify_cached(expression, var)
 
-        xs = np.linspace(-10, 10, 400)
-        ys = func(xs)
+        with np.errstate(all="ignore"):
+            ys = np.asarray(func(_GRAPH_XS))
+        # Complex points are only plottable when their imaginary part vanishes
+        if np.iscomplexobj(ys):
+            ys = np.where(np.isclose(ys.imag, 0), ys.real, np.nan)
+        # Constant expressions come back as a scalar
+        ys = np.broadcast_to(ys.astype(float, copy=False), _GRAPH_XS.shape)
 
         return {
-            "x": xs.tolist(),
-            "y": [float(v) if sp.Float(v) else None for v in ys],
+            "x": _GRAPH_X_LIST,
+            "y": np.where(np.isfinite(ys), ys, None).tolist(),
             "expression": expression,
         }
 
@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+
+from services import collaboration
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    emitted = []
+
+    async def emit(event, data, room=None, skip_sid=None):
+        emitted.append((event, data["n"], room, skip_sid))
+
+    monkeypatch.setattr(collaboration.sio, "emit", emit)
+    return emitted
+
+
+def test_cursor_updates_are_coalesced_per_sid(sent):
+    async def run():
+        for n in range(5):
+            await collaboration.sync_cursor("a", {"roomId": "r", "n": n})
+            await collaboration.sync_cursor("b", {"roomId": "r", "n": 100 + n})
+        await asyncio.sleep(collaboration.CURSOR_FLUSH_INTERVAL * 3)
+
+    asyncio.run(run())
+    assert sent == [("cursor_updated", 4, "r", "a"), ("cursor_updated", 104, "r", "b")]
+
+
+def test_flusher_stops_when_idle_and_restarts(sent):
+    async def run():
+        await collaboration.sync_cursor("a", {"roomId": "r", "n": 1})
+        await asyncio.sleep(collaboration.CURSOR_FLUSH_INTERVAL * 3)
+        assert collaboration._flush_task is None
+        await collaboration.sync_cursor("a", {"roomId": "r", "n": 2})
+        await asyncio.sleep(collaboration.CURSOR_FLUSH_INTERVAL * 3)
+
+    asyncio.run(run())
+    assert [n for _, n, _, _ in sent] == [1, 2]
+
+
+def test_disconnect_drops_pending_cursor(sent):
+    async def run():
+        await collaboration.sync_cursor("a", {"roomId": "r", "n": 1})
+        await collaboration.disconnect("a")
+        await asyncio.sleep(collaboration.CURSOR_FLUSH_INTERVAL * 3)
+
+    asyncio.run(run())
+    assert sent == []
@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+from performance_monitor import CompressedSeries
+
+
+def _replay(series: CompressedSeries, samples):
+    """Write samples the way store_metrics_batch does: APPEND, or SET on compaction."""
+    blob, expected = b"", []
+    for ts, value in samples:
+        chunk = series.append(ts, value)
+        if series.should_compact:
+            blob, expected = series.encode_all(), list(series.samples)
+        else:
+            blob += chunk
+            expected.append((ts, value))
+    return blob, expected
+
+
+def _decoded(blob):
+    timestamps, values = CompressedSeries.decode(blob)
+    return list(zip(timestamps.tolist(), values.tolist()))
+
+
+def test_empty_blob_decodes_to_empty_arrays():
+    timestamps, values = CompressedSeries.decode(b"")
+    assert timestamps.size == 0 and values.size == 0
+
+
+def test_regular_series_round_trips():
+    samples = [(1_700_000_000 + 60 * i, 50.0 + (i % 7) * 0.25) for i in range(100)]
+    blob, expected = _replay(CompressedSeries(), samples)
+    assert _decoded(blob) == expected
+
+
+def test_repeated_values_compress_to_two_bytes():
+    series = CompressedSeries()
+    series.append(1_700_000_000, 1.5)
+    series.append(1_700_000_060, 1.5)
+    # Constant interval after the first delta and an identical value: control byte + zero dod
+    assert len(series.append(1_700_000_120, 1.5)) == 2
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_irregular_series_with_restarts_and_compaction_round_trips(seed):
+    rng = random.Random(seed)
+    series = CompressedSeries(capacity=50)
+    samples, ts = [], 1_700_000_000
+    for _ in range(rng.randint(1, 400)):
+        ts += rng.choice([60, 60, 59, 61, 3600, 1])
+        samples.append((ts, rng.choice([rng.random() * 100, 42.0, float(rng.randint(0, 10**12)), 0.0, -3.5])))
+
+    blob, expected = b"", []
+    for ts, value in samples:
+        if rng.random() < 0.02:
+            series._reset()  # a restarted writer starts a fresh block
+        chunk = series.append(ts, value)
+        if series.should_compact:
+            blob, expected = series.encode_all(), list(series.samples)
+        else:
+            blob += chunk
+            expected.append((ts, value))
+    assert _decoded(blob) == expected
+
+
+def test_compaction_keeps_only_the_last_capacity_samples():
+    series = CompressedSeries(capacity=10)
+    samples = [(1_700_000_000 + 60 * i, float(i)) for i in range(21)]
+    blob, expected = _replay(series, samples)
+    assert _decoded(blob) == samples[-10:] == expected
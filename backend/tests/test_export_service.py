@@ -0,0 +1,102 @@
+import json
+import struct
+
+import numpy as np
+import pytest
+
+from app.services import export_service
+from app.services.export_service import SPHERE_RINGS, SPHERE_SEGMENTS, ExportService
+
+SCENE = {
+    "objects": [
+        {"type": "box", "position": [1, 2, 3], "scale": 2},
+        {"type": "box", "position": [0, 0, 0], "scale": [1, 2, 3]},
+        {"type": "sphere", "position": [0, 5, 0], "radius": 0.5},
+        {
+            "type": "mesh",
+            "position": [10, 0, 0],
+            "scale": 1,
+            "vertices": [[0, 0, 0], [1, 0, 0], [0, 1, 0]],
+            "faces": [[0, 1, 2]],
+        },
+    ]
+}
+
+SPHERE_VERTEX_COUNT = (SPHERE_RINGS + 1) * (SPHERE_SEGMENTS + 1)
+
+
+def test_tessellate_empty_scene():
+    vertices, faces = ExportService.tessellate({})
+    assert vertices.shape == (0, 3) and faces.shape == (0, 3)
+
+
+def test_tessellate_counts_and_dtypes():
+    vertices, faces = ExportService.tessellate(SCENE)
+    assert vertices.dtype == np.float32 and faces.dtype == np.uint32
+    assert vertices.shape == (2 * 8 + SPHERE_VERTEX_COUNT + 3, 3)
+    assert faces.shape == (2 * 12 + 2 * SPHERE_RINGS * SPHERE_SEGMENTS + 1, 3)
+    assert faces.max() == vertices.shape[0] - 1
+
+
+def test_tessellate_places_each_primitive():
+    vertices, faces = ExportService.tessellate(SCENE)
+    first_box, second_box = vertices[:8], vertices[8:16]
+    np.testing.assert_allclose(first_box.min(axis=0), [0, 1, 2])
+    np.testing.assert_allclose(first_box.max(axis=0), [2, 3, 4])
+    np.testing.assert_allclose(second_box.max(axis=0), [0.5, 1, 1.5])
+
+    sphere = vertices[16:16 + SPHERE_VERTEX_COUNT]
+    np.testing.assert_allclose(np.linalg.norm(sphere - [0, 5, 0], axis=1), 0.5, atol=1e-6)
+
+    # The mesh's own indices are offset past everything tessellated before it
+    np.testing.assert_array_equal(faces[-1], np.arange(3) + 16 + SPHERE_VERTEX_COUNT)
+    np.testing.assert_allclose(vertices[faces[-1]], [[10, 0, 0], [11, 0, 0], [10, 1, 0]])
+
+
+def test_write_glb_layout(tmp_path):
+    vertices, faces = ExportService.tessellate(SCENE)
+    path = tmp_path / "scene.glb"
+    ExportService.write_glb(vertices, faces, str(path))
+    data = path.read_bytes()
+
+    magic, version, total = struct.unpack_from("<4sII", data)
+    assert (magic, version, total) == (b"glTF", 2, len(data))
+    json_length, json_type = struct.unpack_from("<I4s", data, 12)
+    assert json_type == b"JSON" and json_length % 4 == 0
+    gltf = json.loads(data[20:20 + json_length])
+    bin_length, bin_type = struct.unpack_from("<I4s", data, 20 + json_length)
+    binary = data[28 + json_length:]
+    assert bin_type == b"BIN\x00" and len(binary) == bin_length == gltf["buffers"][0]["byteLength"]
+
+    positions, indices = gltf["accessors"]
+    assert positions["count"] == vertices.shape[0] and indices["count"] == faces.size
+    position_view, index_view = gltf["bufferViews"]
+    decoded = np.frombuffer(binary, np.float32, positions["count"] * 3, position_view["byteOffset"])
+    np.testing.assert_array_equal(decoded.reshape(-1, 3), vertices)
+    decoded = np.frombuffer(binary, np.uint32, indices["count"], index_view["byteOffset"])
+    np.testing.assert_array_equal(decoded.reshape(-1, 3), faces)
+
+
+def test_write_stl_records(tmp_path):
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 0]], dtype=np.float32)
+    faces = np.array([[0, 1, 2], [0, 3, 3]], dtype=np.uint32)  # second triangle is degenerate
+    path = tmp_path / "scene.stl"
+    ExportService.write_stl(vertices, faces, str(path))
+    data = path.read_bytes()
+
+    (count,) = struct.unpack_from("<I", data, 80)
+    assert count == 2 and len(data) == 84 + 50 * count
+    records = np.frombuffer(
+        data, dtype=[("normal", "<f4", 3), ("vertices", "<f4", (3, 3)), ("attr", "<u2")], offset=84
+    )
+    np.testing.assert_allclose(records["normal"], [[0, 0, 1], [0, 0, 0]])
+    np.testing.assert_array_equal(records["vertices"][0], vertices[:3])
+
+
+def test_export_scene_and_find_export(tmp_path, monkeypatch):
+    monkeypatch.setattr(export_service, "EXPORT_DIR", str(tmp_path))
+    path = ExportService.export_scene(SCENE, "stl", "abc")
+    assert ExportService.find_export("abc") == (path, "stl")
+    assert ExportService.find_export("missing") is None
+    with pytest.raises(ValueError):
+        ExportService.export_scene(SCENE, "obj", "abc")
@@ -0,0 +1,19 @@
+import importlib
+from pathlib import Path
+
+import pytest
+
+BACKEND = Path(__file__).resolve().parent.parent
+
+MODULES = sorted(
+    f"{package}.{path.stem}"
+    for package in ("routes", "services")
+    for path in (BACKEND / package).glob("*.py")
+    if path.stem != "__init__"
+) + ["auth_utils", "main"]
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_module_imports(module):
+    # Catches name clashes like utils.py shadowing the utils/ package
+    importlib.import_module(module)
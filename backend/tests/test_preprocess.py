@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from app.ml.preprocess import INDEX_MCP, MIDDLE_MCP, PINKY_MCP, WRIST, normalize
+
+# The undecorated kernel when numba is installed; normalize itself otherwise
+normalize_py = getattr(normalize, "py_func", normalize)
+
+
+def _landmarks(seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(size=(21, 3)).astype(np.float32)
+
+
+def _reference(landmarks: np.ndarray) -> np.ndarray:
+    points = landmarks.astype(np.float64) - landmarks[WRIST]
+    scale = np.linalg.norm(points[MIDDLE_MCP])
+    y = points[MIDDLE_MCP] / scale
+    x = points[INDEX_MCP] - points[PINKY_MCP]
+    x = x - x.dot(y) * y
+    x /= np.linalg.norm(x)
+    z = np.cross(x, y)
+    return points @ np.stack([x, y, z], axis=1) / scale
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_kernel_matches_fallback(seed):
+    landmarks = _landmarks(seed)
+    out = normalize(landmarks, np.empty_like(landmarks))
+    expected = normalize_py(landmarks, np.empty_like(landmarks))
+    np.testing.assert_allclose(out, expected, rtol=1e-4, atol=1e-5)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_numpy_reference(seed):
+    landmarks = _landmarks(seed)
+    out = normalize(landmarks, np.empty_like(landmarks))
+    np.testing.assert_allclose(out, _reference(landmarks), rtol=1e-4, atol=1e-5)
+
+
+def test_canonical_frame():
+    out = normalize(_landmarks(), np.empty((21, 3), dtype=np.float32))
+    np.testing.assert_allclose(out[WRIST], 0.0, atol=1e-6)
+    np.testing.assert_allclose(out[MIDDLE_MCP], [0.0, 1.0, 0.0], atol=1e-5)
+
+
+def test_invariant_to_position_scale_and_rotation():
+    landmarks = _landmarks()
+    theta = 0.7
+    rotation = np.array(
+        [[np.cos(theta), -np.sin(theta), 0.0], [np.sin(theta), np.cos(theta), 0.0], [0.0, 0.0, 1.0]],
+        dtype=np.float32,
+    )
+    moved = (landmarks @ rotation.T) * 3.0 + np.float32(5.0)
+    np.testing.assert_allclose(
+        normalize(moved, np.empty_like(moved)),
+        normalize(landmarks, np.empty_like(landmarks)),
+        rtol=1e-4,
+        atol=1e-4,
+    )
+
+
+def test_degenerate_hand_is_only_translated():
+    landmarks = np.full((21, 3), 2.0, dtype=np.float32)
+    out = normalize(landmarks, np.empty_like(landmarks))
+    np.testing.assert_array_equal(out, 0.0)
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from utils import security
+
+
+class FakePipeline:
+    def __init__(self, store, fail):
+        self.store, self.fail, self.ops = store, fail, []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def incr(self, key):
+        self.ops.append(key)
+
+    def expire(self, key, seconds):
+        pass
+
+    async def execute(self):
+        if self.fail:
+            raise RedisConnectionError("Redis is down")
+        key = self.ops[0]
+        self.store[key] = self.store.get(key, 0) + 1
+        return [self.store[key], True]
+
+
+class FakeRedis:
+    def __init__(self, fail=False):
+        self.store, self.fail = {}, fail
+
+    def pipeline(self):
+        return FakePipeline(self.store, self.fail)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(security, "redis_client", client)
+    monkeypatch.setattr(security.time, "time", lambda: 1_000.0)
+    return client
+
+
+def _check(max_calls=3, window=60, identifier="user"):
+    asyncio.run(security.check_rate_limit("solve", identifier, max_calls, window))
+
+
+def test_allows_up_to_max_calls_then_429(fake_redis):
+    for _ in range(3):
+        _check()
+    with pytest.raises(HTTPException) as exc:
+        _check()
+    assert exc.value.status_code == 429
+
+
+def test_counters_are_per_identifier(fake_redis):
+    for _ in range(3):
+        _check(identifier="a")
+    _check(identifier="b")
+
+
+def test_next_window_starts_a_fresh_counter(fake_redis, monkeypatch):
+    for _ in range(3):
+        _check()
+    monkeypatch.setattr(security.time, "time", lambda: 1_020.0)  # 1020 // 60 is the next window
+    _check()
+    assert sorted(fake_redis.store) == ["rl:solve:user:16", "rl:solve:user:17"]
+
+
+def test_redis_outage_fails_open(monkeypatch):
+    monkeypatch.setattr(security, "redis_client", FakeRedis(fail=True))
+    for _ in range(10):
+        _check(max_calls=1)
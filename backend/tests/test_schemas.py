@@ -0,0 +1,33 @@
+import pytest
+from pydantic import ValidationError
+
+from schemas import UserCreate, UserLogin, _is_valid_email
+
+
+@pytest.mark.parametrize("schema", [UserCreate, UserLogin])
+def test_email_is_stripped_and_lowercased(schema):
+    user = schema(name="Ada", email="  Ada.Lovelace@Example.COM ", password="password123")
+    assert user.email == "ada.lovelace@example.com"
+
+
+@pytest.mark.parametrize("email", ["not-an-email", "a@", "@example.com", "a b@example.com", ""])
+def test_invalid_email_is_rejected(email):
+    with pytest.raises(ValidationError):
+        UserLogin(email=email, password="x")
+
+
+def test_non_string_email_is_rejected():
+    with pytest.raises(ValidationError):
+        UserLogin(email=123, password="x")
+
+
+def test_validation_is_memoized_on_the_normalized_address():
+    _is_valid_email.cache_clear()
+    UserLogin(email="Cache@Example.com", password="x")
+    UserLogin(email="cache@example.com ", password="x")
+    info = _is_valid_email.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
+def test_schema_still_advertises_email_format():
+    assert UserCreate.model_json_schema()["properties"]["email"]["format"] == "email"
@@ -0,0 +1,61 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from routes import solve
+from schemas import SolveRequest
+
+USER = SimpleNamespace(id=uuid.uuid4())
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    async def allow(*args):
+        return None
+
+    monkeypatch.setattr(solve, "check_rate_limit", allow)
+
+
+def _solve(**payload):
+    return asyncio.run(solve.solve_equation(SolveRequest(**payload), db=None, current_user=USER))
+
+
+def test_typed_equation_skips_ocr_and_has_no_confidence(monkeypatch):
+    async def fail(*args):
+        raise AssertionError("OCR must not run for typed input")
+
+    monkeypatch.setattr(solve.ocr_service, "extract_math_from_image", fail)
+    response = _solve(expression="  x**2 - 4 = 0 ")
+    assert response.source == "typed" and response.confidence is None
+    assert response.expression == "x**2 - 4 = 0"
+    assert response.solution == r"\left[ -2, \  2\right]"
+    # Plotted as lhs - rhs
+    graph = response.graph_data
+    assert graph is not None and len(graph["x"]) == len(graph["y"]) == 400
+    assert graph["y"][0] == pytest.approx(96.0)
+
+
+def test_image_path_reports_ocr_confidence(monkeypatch):
+    async def ocr(image_data):
+        assert image_data == b"png"
+        return "x + 1", 87.5
+
+    monkeypatch.setattr(solve.ocr_service, "extract_math_from_image", ocr)
+    response = _solve(image_base64="cG5n")
+    assert response.source == "ocr" and response.confidence == 87.5
+    assert response.solution == r"\left[ -1\right]"
+
+
+def test_blank_expression_without_image_is_rejected():
+    with pytest.raises(HTTPException) as exc:
+        _solve(expression="   ")
+    assert exc.value.status_code == 400
+
+
+def test_blocked_content_is_rejected():
+    with pytest.raises(HTTPException) as exc:
+        _solve(expression="__import__('os')")
+    assert exc.value.status_code == 400
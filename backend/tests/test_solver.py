@@ -0,0 +1,59 @@
+import pytest
+
+from services.solver import _derivative, _solve_generic, _symbol, _X, solver_service
+
+
+def test_solve_quadratic():
+    latex, steps = solver_service.solve_generic("x**2 - 4")
+    assert latex == r"\left[ -2, \  2\right]"
+    assert "for x" in steps
+
+
+def test_solve_equation_and_system():
+    assert solver_service.solve_generic("2*x = 6")[0] == r"\left[ 3\right]"
+    latex, _ = solver_service.solve_generic("x + y = 2; x - y = 0")
+    assert latex == r"\left\{ x : 1, \  y : 1\right\}"
+
+
+def test_solve_reports_errors_instead_of_raising():
+    latex, steps = solver_service.solve_generic("x +* )")
+    assert latex.startswith("Error:") and steps == "Failed to solve: x +* )"
+
+
+@pytest.mark.parametrize(
+    "method, args, expected",
+    [
+        ("derivative", ("sin(x)",), r"\cos{\left(x \right)}"),
+        ("derivative", ("t**2", "t"), "2 t"),
+        ("integral", ("x",), r"\frac{x^{2}}{2}"),
+        ("limit", ("sin(x)/x", "x", 0), "1"),
+        ("limit", ("1/x", "x", "oo"), "0"),
+        ("factor_polynomial", ("x**2 - 1",), r"\left(x - 1\right) \left(x + 1\right)"),
+        ("trig_simplify", ("sin(x)**2 + cos(x)**2",), "1"),
+    ],
+)
+def test_operations(method, args, expected):
+    assert getattr(solver_service, method)(*args)[0] == expected
+
+
+def test_repeat_calls_are_served_from_cache():
+    _derivative.cache_clear()
+    first = solver_service.derivative("x**3")
+    assert solver_service.derivative("x**3") is first
+    assert _derivative.cache_info().hits == 1
+
+    _solve_generic.cache_clear()
+    solver_service.solve_generic("x - 1")
+    solver_service.solve_generic("x - 1")
+    assert _solve_generic.cache_info().hits == 1
+
+
+def test_symbols_are_interned():
+    assert _symbol("x") is _X
+    assert str(_symbol("theta")) == "theta"
+
+
+def test_graph_data_drops_non_finite_points():
+    data = solver_service.build_graph_data("log(x)")
+    assert len(data["x"]) == len(data["y"]) == 400
+    assert data["y"][0] is None and data["y"][-1] == pytest.approx(2.302585, rel=1e-5)
@@ -1,14 +1,22 @@
 import logging
 import sys
+
+import orjson
 from pythonjsonlogger import jsonlogger
 
+
+def _orjson_serializer(obj, **kwargs):
+    # python-json-logger passes json.dumps-style kwargs; only the fallback matters
+    return orjson.dumps(obj, default=kwargs.get("default") or str).decode()
+
 def setup_logging():
     logger = logging.getLogger()
     logHandler = logging.StreamHandler(sys.stdout)
     
     # Using JSON formatter for production-ready structured logging
     formatter = jsonlogger.JsonFormatter(
-        '%(asctime)s %(levelname)s %(name)s %(message)s'
+        '%(asctime)s %(levelname)s %(name)s %(message)s',
+        json_serializer=_orjson_serializer,
     )
     logHandler.setFormatter(formatter)
     logger.addHandler(logHandler)
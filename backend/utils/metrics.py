@@ -0,0 +1,46 @@
+import time
+
+from fastapi import Request, Response
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+
+REQUEST_COUNT = Counter('http_requests_total', 'Total HTTP requests', ['method', 'endpoint', 'status'])
+REQUEST_DURATION = Histogram('http_request_duration_seconds', 'HTTP request duration')
+
+STATUS_CLASSES = ("1xx", "2xx", "3xx", "4xx", "5xx")
+
+# (method, route path, status class) -> pre-bound child counter
+REQUEST_COUNT_CHILDREN = {}
+
+
+def _bind_children(app):
+    for route in app.routes:
+        for method in getattr(route, "methods", None) or ():
+            for status_class in STATUS_CLASSES:
+                key = (method, route.path, status_class)
+                REQUEST_COUNT_CHILDREN[key] = REQUEST_COUNT.labels(*key)
+
+
+def setup_metrics(app):
+    @app.on_event("startup")
+    async def bind_request_counters() -> None:
+        # Routes are all registered by now; bind their label children once
+        _bind_children(app)
+
+    @app.middleware("http")
+    async def record_request(request: Request, call_next):
+        start = time.perf_counter()
+        response = await call_next(request)
+        REQUEST_DURATION.observe(time.perf_counter() - start)
+
+        # Label by route template, not raw path, to keep cardinality fixed
+        route = request.scope.get("route")
+        key = (request.method, route.path if route else "unmatched", STATUS_CLASSES[response.status_code // 100 - 1])
+        child = REQUEST_COUNT_CHILDREN.get(key)
+        if child is None:
+            child = REQUEST_COUNT_CHILDREN[key] = REQUEST_COUNT.labels(*key)
+        child.inc()
+        return response
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> Response:
+        return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
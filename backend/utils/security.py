@@ -3,18 +3,56 @@ from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 import redis.asyncio as redis
+from redis.exceptions import RedisError
+import logging
 import os
+import time
+
+logger = logging.getLogger(__name__)
 
 # Rate Limiter setup
 limiter = Limiter(key_func=get_remote_address)
 
 # Redis setup
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-redis_client = redis.from_url(REDIS_URL, decode_responses=True)
+# Bounded pool: bursts wait for a free connection instead of opening new ones
+redis_pool = redis.BlockingConnectionPool.from_url(
+    REDIS_URL,
+    max_connections=int(os.getenv("REDIS_POOL", "64")),
+    timeout=5,
+    decode_responses=True,
+    socket_keepalive=True,
+    health_check_interval=30,
+)
+redis_client = redis.Redis(connection_pool=redis_pool)
+
+async def check_rate_limit(scope: str, identifier: str, max_calls: int, window: int) -> None:
+    """Fixed-window INCR+EXPIRE counter shared by every worker process; 429 once exceeded.
+
+    Fails open: if Redis is unavailable the call is allowed and the error logged,
+    so a cache outage degrades limiting rather than the routes behind it.
+    """
+    key = f"rl:{scope}:{identifier}:{int(time.time()) // window}"
+    try:
+        async with redis_client.pipeline() as pipe:
+            pipe.incr(key)
+            pipe.expire(key, window)
+            count, _ = await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Rate limit check skipped for {scope}: {e}")
+        return
+    if count > max_calls:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded. Please slow down.",
+        )
 
 async def get_cache(key: str):
     return await redis_client.get(key)
 
+async def mget_cache(keys: list[str]) -> list:
+    return await redis_client.mget(keys)
+
 async def set_cache(key: str, value: str, expire: int = 3600):
     await redis_client.set(key, value, ex=expire)
 
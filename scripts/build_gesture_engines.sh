@@ -0,0 +1,65 @@
+#!/bin/bash
+# Build the TensorRT gesture engine for the GPU on this host.
+# TensorRT engines are not portable across SM versions, so this runs once per
+# target architecture (sm_86, sm_89, sm_90) and writes gesture.sm<SM>.engine.
+#
+# INT8 (per-channel, calibrated) is preferred; it is only kept when its
+# measured latency is within MAX_INT8_REGRESSION percent of FP16, since some
+# layers run slower in INT8 than FP16.
+#
+# CALIB_CACHE must be produced beforehand from ~500 recorded landmark frames.
+
+set -euo pipefail
+
+ONNX_PATH="${ONNX_PATH:-models/gesture.onnx}"
+CALIB_CACHE="${CALIB_CACHE:-models/calib.cache}"
+OUTPUT_DIR="${OUTPUT_DIR:-models}"
+MAX_INT8_REGRESSION="${MAX_INT8_REGRESSION:-5}"
+
+log() {
+    echo "[$(date +'%Y-%m-%d %H:%M:%S')] $1"
+}
+
+# Mean GPU compute time (ms) from a trtexec log
+mean_latency() {
+    grep -oP 'GPU Compute Time: .*?mean = \K[0-9.]+' "$1" | head -1
+}
+
+build_engine() {
+    local engine="$1"
+    local log_file="$2"
+    shift 2
+    trtexec --onnx="$ONNX_PATH" "$@" \
+        --saveEngine="$engine" \
+        --dumpProfile --separateProfileRun \
+        > "$log_file" 2>&1
+}
+
+SM=$(nvidia-smi --query-gpu=compute_cap --format=csv,noheader | head -1 | tr -d '.')
+WORK_DIR=$(mktemp -d)
+trap 'rm -rf "$WORK_DIR"' EXIT
+
+mkdir -p "$OUTPUT_DIR"
+TARGET="$OUTPUT_DIR/gesture.sm${SM}.engine"
+
+log "Building FP16 engine for sm_${SM}"
+build_engine "$WORK_DIR/fp16.engine" "$WORK_DIR/fp16.log" --fp16
+FP16_MS=$(mean_latency "$WORK_DIR/fp16.log")
+
+if [[ ! -f "$CALIB_CACHE" ]]; then
+    log "No calibration cache at $CALIB_CACHE, shipping FP16 (${FP16_MS} ms)"
+    cp "$WORK_DIR/fp16.engine" "$TARGET"
+    exit 0
+fi
+
+log "Building INT8 engine for sm_${SM}"
+build_engine "$WORK_DIR/int8.engine" "$WORK_DIR/int8.log" --int8 --calib="$CALIB_CACHE" --best
+INT8_MS=$(mean_latency "$WORK_DIR/int8.log")
+
+if awk -v i="$INT8_MS" -v f="$FP16_MS" -v r="$MAX_INT8_REGRESSION" 'BEGIN { exit !(i <= f * (1 + r / 100)) }'; then
+    log "Shipping INT8 (${INT8_MS} ms vs FP16 ${FP16_MS} ms)"
+    cp "$WORK_DIR/int8.engine" "$TARGET"
+else
+    log "INT8 regressed (${INT8_MS} ms vs FP16 ${FP16_MS} ms), shipping FP16"
+    cp "$WORK_DIR/fp16.engine" "$TARGET"
+fi